@@ -1,22 +1,47 @@
 import streamlit as st
-import pandas as pd
-import json
-from resume_parser import ResumeParser
-from data_exporter import DataExporter
-from database_manager import DatabaseManager
+from resume_parser import get_shared_parser, parse_resume_in_worker
+import worker_init
+from database_manager import DatabaseManager, SEARCHABLE_FIELDS
+from config import MAX_IN_MEMORY_PARSE_MB, PARSE_CACHE_MAX_ENTRIES, MAX_EXPORT_RESUMES
 import tempfile
+import shutil
+import hashlib
+import atexit
 import os
 import time
+import threading
+from collections import OrderedDict, defaultdict
+from pathlib import PurePath
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Initialize the resume parser and database
 @st.cache_resource
 def get_resume_parser():
-    return ResumeParser()
+    # The process-wide parser, also used by parse_resume_in_worker in this process
+    return get_shared_parser()
 
 @st.cache_resource
 def get_database_manager():
     return DatabaseManager()
 
+@st.cache_resource
+def get_parse_cache():
+    # Parse results keyed by upload content hash, shared across reruns and sessions
+    return OrderedDict()
+
+@st.cache_resource
+def get_parse_cache_lock():
+    # Sessions run in separate threads, so every parse cache access holds this lock
+    return threading.Lock()
+
+@st.cache_resource
+def get_upload_dir():
+    # One temporary directory for all uploads, removed when the app exits
+    upload_dir = tempfile.mkdtemp(prefix="resume_")
+    atexit.register(shutil.rmtree, upload_dir, ignore_errors=True)
+    return upload_dir
+
 def main():
     st.title("🔍 Resume Parser & Analysis Tool")
     st.markdown("Upload resumes in PDF or DOCX format to extract structured information for recruitment screening.")
@@ -54,157 +79,406 @@ def upload_and_parse_page(parser, db_manager):
     )
     
     if uploaded_files:
-        # Process each uploaded file
+        parse_cache = get_parse_cache()
+        upload_dir = get_upload_dir()
+        cached_results = []
+        pending_files = []
+        content_hashes = {}
+        
+        seen_files = {}
+        
         for uploaded_file in uploaded_files:
-            st.subheader(f"Processing: {uploaded_file.name}")
+            content_hash = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=32).hexdigest()
             
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_file_path = tmp_file.name
+            # Results and their widgets are keyed by content, so show each file once per batch
+            if content_hash in seen_files:
+                st.info(f"Skipping {uploaded_file.name}: identical to {seen_files[content_hash]}")
+                continue
+            seen_files[content_hash] = uploaded_file.name
+            content_hashes[uploaded_file.file_id] = content_hash
             
-            try:
-                # Parse the resume with timing
-                start_time = time.time()
-                with st.spinner("Parsing resume..."):
-                    parsed_data = parser.parse_resume(tmp_file_path)
-                processing_time = time.time() - start_time
-                
-                if parsed_data:
-                    # Save to database
-                    record_id = db_manager.save_parsed_resume(
-                        parsed_data, 
-                        uploaded_file.name, 
-                        processing_time
-                    )
-                    
-                    if record_id:
-                        st.success(f"Resume saved to database with ID: {record_id}")
-                    else:
-                        st.warning("Resume parsed but failed to save to database")
-                    
-                    # Display results
-                    display_parsed_results(parsed_data, uploaded_file.name)
-                    
-                    # Export options
-                    st.subheader("📤 Export Options")
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        if st.button(f"Export JSON", key=f"json_{uploaded_file.name}"):
-                            json_data = DataExporter.to_json(parsed_data)
-                            st.download_button(
-                                label="Download JSON",
-                                data=json_data,
-                                file_name=f"{uploaded_file.name.split('.')[0]}_parsed.json",
-                                mime="application/json"
-                            )
-                    
-                    with col2:
-                        if st.button(f"Export CSV", key=f"csv_{uploaded_file.name}"):
-                            csv_data = DataExporter.to_csv(parsed_data)
-                            st.download_button(
-                                label="Download CSV",
-                                data=csv_data,
-                                file_name=f"{uploaded_file.name.split('.')[0]}_parsed.csv",
-                                mime="text/csv"
-                            )
-                    
-                    with col3:
-                        if st.button(f"Export Excel", key=f"excel_{uploaded_file.name}"):
-                            excel_data = DataExporter.to_excel(parsed_data)
-                            if excel_data:
-                                st.download_button(
-                                    label="Download Excel",
-                                    data=excel_data,
-                                    file_name=f"{uploaded_file.name.split('.')[0]}_parsed.xlsx",
-                                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                                )
-                else:
-                    error_msg = f"Failed to parse {uploaded_file.name}"
-                    st.error(error_msg)
-                    # Save error record
-                    db_manager.save_error_record(
-                        uploaded_file.name, 
-                        error_msg,
-                        len(uploaded_file.getvalue())
-                    )
-                    
-            except Exception as e:
-                error_msg = f"Error processing {uploaded_file.name}: {str(e)}"
-                st.error(error_msg)
-                # Save error record
-                db_manager.save_error_record(
-                    uploaded_file.name, 
-                    error_msg,
-                    len(uploaded_file.getvalue())
-                )
+            # Identical files are served from the in-memory cache or the database
+            cached = get_cached_parse(parse_cache, content_hash)
+            if cached is None:
+                stored_resume = db_manager.get_resume_by_content_hash(content_hash)
+                if stored_resume:
+                    cached = (stored_resume.to_parsed_data(), stored_resume.id)
+                    store_cached_parse(parse_cache, content_hash, cached)
+            if cached is not None:
+                cached_results.append((uploaded_file, cached))
+                continue
             
-            finally:
-                # Clean up temporary file
-                if os.path.exists(tmp_file_path):
-                    os.unlink(tmp_file_path)
+            # Small uploads are parsed straight from memory; larger ones are written
+            # to the shared upload directory first so they can be parsed concurrently
+            if uploaded_file.size <= MAX_IN_MEMORY_PARSE_MB * 1024 * 1024:
+                pending_files.append((uploaded_file.getvalue(), uploaded_file))
+                continue
+            
+            # Every upload gets its own file, so concurrent sessions never parse
+            # or delete each other's copies
+            tmp_file = tempfile.NamedTemporaryFile(
+                dir=upload_dir, suffix=PurePath(uploaded_file.name).suffix, delete=False
+            )
+            try:
+                with tmp_file:
+                    # Stream in 1 MB chunks rather than copying the whole upload into memory;
+                    # rewind first in case the buffer was already read on an earlier rerun
+                    uploaded_file.seek(0)
+                    shutil.copyfileobj(uploaded_file, tmp_file, 1024 * 1024)
+            except Exception:
+                # Don't leave a truncated copy behind
+                os.unlink(tmp_file.name)
+                raise
+            pending_files.append((tmp_file.name, uploaded_file))
+        
+        for uploaded_file, (parsed_data, record_id) in cached_results:
+            st.subheader(f"Processing: {uploaded_file.name}")
+            show_upload_result(uploaded_file, content_hashes[uploaded_file.file_id], parsed_data, record_id,
+                               already_stored=True)
+            st.divider()
+        
+        if not pending_files:
+            return
+        
+        parse_results = []
+        try:
+            progress = st.progress(0.0, text="Parsing resumes...")
+            for done, result in enumerate(parse_uploaded_files(parser, pending_files), start=1):
+                progress.progress(done / len(pending_files), text=f"Parsed {done} of {len(pending_files)} resumes")
+                parse_results.append(result)
+        
+        finally:
+            # Clean up temporary files
+            for source, _ in pending_files:
+                if isinstance(source, str) and os.path.exists(source):
+                    os.unlink(source)
+        
+        # Save the whole batch at once, then display each result
+        record_ids = save_parse_results(parse_results, content_hashes, db_manager)
+        for (uploaded_file, parsed_data, processing_time, error_msg), record_id in zip(parse_results, record_ids):
+            # Only results that made it into the database are served again
+            if parsed_data and record_id is not None:
+                store_cached_parse(parse_cache, content_hashes[uploaded_file.file_id], (parsed_data, record_id))
             
+            st.subheader(f"Processing: {uploaded_file.name}")
+            show_upload_result(uploaded_file, content_hashes[uploaded_file.file_id], parsed_data, record_id, error_msg)
             st.divider()
 
+def get_cached_parse(parse_cache, content_hash):
+    """Look up a cached parse result, marking it as recently used"""
+    with get_parse_cache_lock():
+        result = parse_cache.get(content_hash)
+        if result is not None:
+            parse_cache.move_to_end(content_hash)
+        return result
+
+def store_cached_parse(parse_cache, content_hash, result):
+    """Remember a parse result, evicting the least recently used entries"""
+    with get_parse_cache_lock():
+        parse_cache[content_hash] = result
+        parse_cache.move_to_end(content_hash)
+        while len(parse_cache) > PARSE_CACHE_MAX_ENTRIES:
+            parse_cache.popitem(last=False)
+
+def parse_uploaded_files(parser, pending_files):
+    """
+    Parse uploaded resumes, yielding each result as soon as it is ready
+    
+    A single file is parsed in-process with the cached parser; batches are
+    spread over a process pool so files are parsed in parallel.
+    
+    Args:
+        parser (ResumeParser): Cached parser used for single uploads
+        pending_files (list): (temporary file path or file bytes, uploaded file) pairs
+        
+    Yields:
+        tuple: (uploaded file, parsed data, processing time, error message)
+    """
+    if len(pending_files) == 1:
+        source, uploaded_file = pending_files[0]
+        start_time = time.time()
+        with st.spinner("Parsing resume..."):
+            try:
+                parsed_data = parser.parse_resume(source, uploaded_file.name)
+            except Exception as e:
+                yield uploaded_file, None, time.time() - start_time, f"Error processing {uploaded_file.name}: {str(e)}"
+                return
+        yield parse_result(uploaded_file, parsed_data, time.time() - start_time)
+        return
+    
+    max_workers = min(len(pending_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=worker_init.get_mp_context(),
+        initializer=worker_init.init
+    ) as executor:
+        futures = {
+            executor.submit(parse_resume_in_worker, source, uploaded_file.name): uploaded_file
+            for source, uploaded_file in pending_files
+        }
+        for future in as_completed(futures):
+            uploaded_file = futures[future]
+            try:
+                parsed_data, processing_time = future.result()
+            except Exception as e:
+                yield uploaded_file, None, None, f"Error processing {uploaded_file.name}: {str(e)}"
+            else:
+                yield parse_result(uploaded_file, parsed_data, processing_time)
+
+def parse_result(uploaded_file, parsed_data, processing_time):
+    """Build a parse result tuple, flagging uploads the parser could not handle"""
+    error_msg = None if parsed_data else f"Failed to parse {uploaded_file.name}"
+    return uploaded_file, parsed_data, processing_time, error_msg
+
+def save_parse_results(parse_results, content_hashes, db_manager):
+    """
+    Save a batch of parse results to the database
+    
+    Successful parses are written in a single transaction; failures are
+    recorded as error records.
+    
+    Returns:
+        list: Record ID for each parse result, None where nothing was saved
+    """
+    saved_ids = iter(db_manager.save_parsed_resumes_bulk([
+        (parsed_data, uploaded_file.name, processing_time, content_hashes[uploaded_file.file_id])
+        for uploaded_file, parsed_data, processing_time, error_msg in parse_results
+        if not error_msg
+    ]))
+    
+    record_ids = []
+    for uploaded_file, parsed_data, processing_time, error_msg in parse_results:
+        if error_msg:
+            # Save error record
+            db_manager.save_error_record(
+                uploaded_file.name, 
+                error_msg,
+                uploaded_file.size
+            )
+            record_ids.append(None)
+        else:
+            record_ids.append(next(saved_ids))
+    
+    # Drop the bulk export files now rather than keep them until the next export
+    if any(record_id is not None for record_id in record_ids):
+        get_bulk_export.clear()
+    
+    return record_ids
+
+def show_upload_result(uploaded_file, content_hash, parsed_data, record_id, error_msg=None, already_stored=False):
+    """Display the outcome of parsing and saving an uploaded resume"""
+    if error_msg:
+        st.error(error_msg)
+        return
+    
+    if already_stored:
+        st.info(f"Resume already parsed and stored in database with ID: {record_id}")
+    elif record_id:
+        st.success(f"Resume saved to database with ID: {record_id}")
+    else:
+        st.warning("Resume parsed but failed to save to database")
+    
+    # Display results
+    display_parsed_results(parsed_data, uploaded_file.name)
+    
+    # Export options
+    show_export_buttons(uploaded_file, content_hash, parsed_data)
+
+@st.fragment
+def show_export_buttons(uploaded_file, content_hash, parsed_data):
+    """Export download buttons; clicking one only reruns this fragment, not the whole results page"""
+    stem = PurePath(uploaded_file.name).stem
+    
+    st.subheader("📤 Export Options")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.download_button(
+            label="Download JSON",
+            data=get_export_data(content_hash, 'json', parsed_data),
+            file_name=f"{stem}_parsed.json",
+            mime="application/json",
+            key=f"json_{content_hash[:16]}"
+        )
+    
+    with col2:
+        st.download_button(
+            label="Download CSV",
+            data=get_export_data(content_hash, 'csv', parsed_data),
+            file_name=f"{stem}_parsed.csv",
+            mime="text/csv",
+            key=f"csv_{content_hash[:16]}"
+        )
+    
+    with col3:
+        excel_data = get_export_data(content_hash, 'excel', parsed_data)
+        if excel_data:
+            st.download_button(
+                label="Download Excel",
+                data=excel_data,
+                file_name=f"{stem}_parsed.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                key=f"excel_{content_hash[:16]}"
+            )
+    
+    with col4:
+        parquet_data = get_export_data(content_hash, 'parquet', parsed_data)
+        if parquet_data:
+            st.download_button(
+                label="Download Parquet",
+                data=parquet_data,
+                file_name=f"{stem}_parsed.parquet",
+                mime="application/vnd.apache.parquet",
+                key=f"parquet_{content_hash[:16]}"
+            )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_export_data(content_hash, export_format, _parsed_data):
+    # Export payloads are built once per uploaded file and format, not on every rerun
+    from data_exporter import DataExporter  # pulls in pyarrow and the Excel writers, so only load it when exporting
+    
+    if export_format == 'json':
+        return DataExporter.to_json(_parsed_data)
+    elif export_format == 'csv':
+        return DataExporter.to_csv(_parsed_data)
+    elif export_format == 'excel':
+        return DataExporter.to_excel(_parsed_data)
+    elif export_format == 'parquet':
+        return DataExporter.to_parquet(_parsed_data)
+    raise ValueError(f"Unsupported export format: {export_format}")
+
 def view_stored_resumes_page(db_manager):
     """View stored resumes page"""
     st.header("📊 Stored Resumes")
     
-    # Get all resumes
-    resumes = db_manager.get_all_resumes(limit=50)
+    # Get summary rows for the most recent resumes
+    rows = db_manager.list_resumes_summary(limit=50)
     
-    if not resumes:
+    if not rows:
         st.info("No resumes found in database")
         return
     
     # Display summary
-    st.metric("Total Stored Resumes", len(resumes))
+    st.metric("Total Stored Resumes", len(rows))
     
     # Create table data
-    table_data = []
-    for resume in resumes:
-        table_data.append({
-            "ID": resume.id,
-            "Name": resume.candidate_name or "Unknown",
-            "Email": resume.email or "N/A",
-            "Score": resume.overall_score,
-            "Upload Date": resume.upload_timestamp.strftime("%Y-%m-%d %H:%M") if resume.upload_timestamp else "N/A",
-            "Status": "✅ Success" if resume.is_processed_successfully else "❌ Failed"
-        })
-    
-    df = pd.DataFrame(table_data)
+    df = resume_summary_frame(rows, "%Y-%m-%d %H:%M")
     
     # Display interactive table
     selected_resume = st.selectbox(
         "Select a resume to view details:",
-        options=[""] + [f"ID {r.id} - {r.candidate_name or r.filename}" for r in resumes]
+        options=[""] + [f"ID {row.id} - {row.candidate_name or row.filename}" for row in rows]
     )
     
     if selected_resume:
         resume_id = int(selected_resume.split()[1])
-        selected_resume_data = db_manager.get_resume_by_id(resume_id)
+        selected_resume_data = get_stored_resume(db_manager, resume_id)
         
         if selected_resume_data:
             display_stored_resume_details(selected_resume_data, db_manager)
     
     # Show table
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(df[["ID", "Name", "Email", "Score", "Upload Date"]], use_container_width=True)
+    
+    bulk_export_panel(db_manager)
+
+@st.fragment
+def bulk_export_panel(db_manager):
+    """Bulk export of the stored resumes, built only when the user asks for it"""
+    if st.button("Prepare Export of All Stored Resumes"):
+        st.session_state.bulk_export_requested = True
+    
+    if not st.session_state.get('bulk_export_requested'):
+        return
+    
+    bulk_export = get_bulk_export(db_manager, db_manager.get_latest_resume_id())
+    
+    if not bulk_export['parquet']:
+        st.info("No successfully parsed resumes to export")
+        return
+    
+    st.download_button(
+        label="Download All Stored Resumes (Parquet)",
+        data=bulk_export['parquet'],
+        file_name="stored_resumes.parquet",
+        mime="application/vnd.apache.parquet"
+    )
+    
+    if bulk_export['excel']:
+        st.download_button(
+            label="Download All Stored Resumes (Excel)",
+            data=bulk_export['excel'],
+            file_name="stored_resumes.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def get_stored_resume(_db_manager, resume_id):
+    # Reruns reuse the loaded record for a minute; only the most recently viewed resumes are kept.
+    # Plain data is cached rather than the ORM object, which is detached and shared across sessions.
+    resume = _db_manager.get_resume_by_id(resume_id)
+    if resume is None:
+        return None
+    return {
+        'id': resume.id,
+        'upload_timestamp': resume.upload_timestamp,
+        'processing_time_seconds': resume.processing_time_seconds,
+        'parsed_data': resume.to_parsed_data()
+    }
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def get_bulk_export(_db_manager, latest_resume_id):
+    # Both bulk export files, built once and shared by every session until a newer resume is stored
+    resumes = islice(_db_manager.stream_resumes(successful_only=True), MAX_EXPORT_RESUMES)
+    parsed_resumes = [resume.to_parsed_data() for resume in resumes]
+    
+    from data_exporter import DataExporter
+    return {
+        'parquet': DataExporter.to_parquet(parsed_resumes) if parsed_resumes else None,
+        'excel': DataExporter.to_excel_batch(parsed_resumes) if parsed_resumes else None
+    }
+
+def resume_summary_frame(rows, date_format):
+    """Build a display table from DatabaseManager.list_resumes_summary rows"""
+    import pandas as pd  # deferred so pages without tables don't pay for the import
+    
+    df = pd.DataFrame.from_records(
+        rows,
+        columns=["ID", "Name", "Filename", "Email", "Score", "Upload Date"]
+    )
+    
+    df["Name"] = df["Name"].fillna("Unknown")
+    df["Email"] = df["Email"].fillna("N/A")
+    df["Upload Date"] = pd.to_datetime(df["Upload Date"]).dt.strftime(date_format).fillna("N/A")
+    
+    return df
 
 def search_database_page(db_manager):
     """Search database page"""
     st.header("🔍 Search Resumes")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        search_field = st.selectbox(
-            "Search by:",
-            ["candidate_name", "email", "location", "filename"]
-        )
+    search_panel(db_manager)
+
+@st.fragment
+def search_panel(db_manager):
+    """Search form and results, rerun on their own when a search is submitted"""
+    # Only query the database when the form is submitted, not on every edit
+    with st.form("search_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            search_field = st.selectbox(
+                "Search by:",
+                list(SEARCHABLE_FIELDS) + ['skill']
+            )
+        
+        with col2:
+            search_term = st.text_input("Search term:")
+        
+        if st.form_submit_button("Search"):
+            st.session_state.search_query = (search_field, search_term.strip())
     
-    with col2:
-        search_term = st.text_input("Search term:")
+    search_field, search_term = st.session_state.get('search_query', (None, ''))
     
     if search_term:
         results = db_manager.search_resumes(search_term, search_field)
@@ -224,7 +498,6 @@ def search_database_page(db_manager):
                     with col2:
                         st.write(f"**Overall Score:** {resume.overall_score}")
                         st.write(f"**Filename:** {resume.filename}")
-                        st.write(f"**Processing:** {'Success' if resume.is_processed_successfully else 'Failed'}")
                     
                     if resume.professional_summary:
                         st.write("**Summary:**")
@@ -237,7 +510,7 @@ def analytics_dashboard_page(db_manager):
     st.header("📈 Analytics Dashboard")
     
     # Get statistics
-    stats = db_manager.get_statistics()
+    stats = get_cached_statistics(db_manager)
     
     if not stats:
         st.error("Unable to load statistics")
@@ -264,50 +537,53 @@ def analytics_dashboard_page(db_manager):
         'Status': ['Successful', 'Failed'],
         'Count': [stats.get('successful_parses', 0), stats.get('failed_parses', 0)]
     }
+    import pandas as pd
     st.bar_chart(pd.DataFrame(success_data).set_index('Status'))
     
     # Recent resumes
     st.subheader("Recent Uploads")
-    recent_resumes = db_manager.get_all_resumes(limit=10)
-    
-    if recent_resumes:
-        recent_data = []
-        for resume in recent_resumes:
-            recent_data.append({
-                "Name": resume.candidate_name or "Unknown",
-                "Score": resume.overall_score,
-                "Date": resume.upload_timestamp.strftime("%Y-%m-%d") if resume.upload_timestamp else "N/A",
-                "Status": "Success" if resume.is_processed_successfully else "Failed"
-            })
+    recent_rows = db_manager.list_resumes_summary(limit=10)
+    
+    if recent_rows:
+        recent_df = resume_summary_frame(recent_rows, "%Y-%m-%d")
+        recent_df = recent_df.rename(columns={"Upload Date": "Date"})
         
-        st.dataframe(pd.DataFrame(recent_data), use_container_width=True)
+        st.dataframe(recent_df[["Name", "Score", "Date"]], use_container_width=True)
+
+@st.cache_data(ttl=60)
+def get_cached_statistics(_db_manager):
+    # Dashboard statistics, recomputed at most once a minute
+    return _db_manager.get_statistics()
 
+@st.fragment
 def display_stored_resume_details(resume, db_manager):
-    """Display detailed view of stored resume"""
-    st.subheader(f"Resume Details - {resume.candidate_name or 'Unknown'}")
+    """Display detailed view of stored resume (as returned by get_stored_resume)"""
+    parsed_data = resume['parsed_data']
+    personal_info = parsed_data['personal_info']
+    st.subheader(f"Resume Details - {personal_info.get('name') or 'Unknown'}")
     
     # Basic information
     col1, col2 = st.columns(2)
     
     with col1:
-        st.write(f"**ID:** {resume.id}")
-        st.write(f"**Name:** {resume.candidate_name or 'N/A'}")
-        st.write(f"**Email:** {resume.email or 'N/A'}")
-        st.write(f"**Phone:** {resume.phone or 'N/A'}")
+        st.write(f"**ID:** {resume['id']}")
+        st.write(f"**Name:** {personal_info.get('name') or 'N/A'}")
+        st.write(f"**Email:** {personal_info.get('email') or 'N/A'}")
+        st.write(f"**Phone:** {personal_info.get('phone') or 'N/A'}")
     
     with col2:
-        st.write(f"**Location:** {resume.location or 'N/A'}")
-        st.write(f"**Upload Date:** {resume.upload_timestamp}")
-        st.write(f"**Overall Score:** {resume.overall_score}")
-        st.write(f"**Processing Time:** {resume.processing_time_seconds:.2f}s" if resume.processing_time_seconds else "N/A")
+        st.write(f"**Location:** {personal_info.get('location') or 'N/A'}")
+        st.write(f"**Upload Date:** {resume['upload_timestamp']}")
+        st.write(f"**Overall Score:** {parsed_data['overall_score']}")
+        st.write(f"**Processing Time:** {resume['processing_time_seconds']:.2f}s" if resume['processing_time_seconds'] else "N/A")
     
     # Professional summary
-    if resume.professional_summary:
+    if parsed_data['summary']:
         st.subheader("Professional Summary")
-        st.write(resume.professional_summary)
+        st.write(parsed_data['summary'])
     
     # Experience
-    experience_data = resume.get_experience_data()
+    experience_data = parsed_data['experience']
     if experience_data:
         st.subheader("Work Experience")
         for i, exp in enumerate(experience_data):
@@ -317,7 +593,7 @@ def display_stored_resume_details(resume, db_manager):
                     st.write(f"**Description:** {exp['description']}")
     
     # Education
-    education_data = resume.get_education_data()
+    education_data = parsed_data['education']
     if education_data:
         st.subheader("Education")
         for edu in education_data:
@@ -326,23 +602,21 @@ def display_stored_resume_details(resume, db_manager):
                 st.write(f"Year: {edu['year']}")
     
     # Skills
-    skills_data = resume.get_skills_data()
+    skills_data = parsed_data['skills']
     if skills_data:
         st.subheader("Skills")
-        skills_by_category = {}
-        for skill in skills_data:
-            if isinstance(skill, dict):
-                category = skill.get('category', 'General')
-                if category not in skills_by_category:
-                    skills_by_category[category] = []
-                skills_by_category[category].append(skill.get('name', ''))
+        skills_by_category = group_skills_by_category(skills_data)
         
         for category, skills in skills_by_category.items():
             st.write(f"**{category}:** {', '.join(skills)}")
     
     # Delete option
-    if st.button(f"Delete Resume {resume.id}", type="secondary"):
-        if db_manager.delete_resume(resume.id):
+    if st.button(f"Delete Resume {resume['id']}", type="secondary"):
+        if db_manager.delete_resume(resume['id']):
+            get_stored_resume.clear()
+            # Don't let the bulk exports keep offering the deleted resume
+            get_bulk_export.clear()
+            st.session_state.pop('bulk_export_requested', None)
             st.success("Resume deleted successfully")
             st.rerun()
         else:
@@ -378,6 +652,16 @@ def display_stored_resume_details(resume, db_manager):
         - Your data privacy is our priority
         """)
 
+def group_skills_by_category(skills):
+    """Group skill names by category, keeping categories in first-seen order"""
+    skills_by_category = defaultdict(list)
+    for skill in skills:
+        if isinstance(skill, dict):
+            skills_by_category[skill.get('category', 'General')].append(skill.get('name', ''))
+        else:
+            skills_by_category['General'].append(skill)
+    return skills_by_category
+
 def display_parsed_results(parsed_data, filename):
     """Display parsed resume data in organized sections"""
     
@@ -458,17 +742,7 @@ def display_parsed_results(parsed_data, filename):
     
     if skills:
         # Group skills by category if available
-        skill_categories = {}
-        for skill in skills:
-            if isinstance(skill, dict):
-                category = skill.get('category', 'General')
-                if category not in skill_categories:
-                    skill_categories[category] = []
-                skill_categories[category].append(skill.get('name', skill))
-            else:
-                if 'General' not in skill_categories:
-                    skill_categories['General'] = []
-                skill_categories['General'].append(skill)
+        skill_categories = group_skills_by_category(skills)
         
         for category, category_skills in skill_categories.items():
             st.write(f"**{category}:**")
@@ -1,10 +1,49 @@
 import json
 import csv
 import io
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from datetime import datetime
 import logging
 
+try:
+    import orjson  # optional, much faster JSON encoding
+except ImportError:
+    orjson = None
+
+try:
+    import xlsxwriter  # optional, faster Excel writer; openpyxl is used without it
+except ImportError:
+    xlsxwriter = None
+
+# Sections scored by ResumeParser._calculate_confidence_scores
+CONFIDENCE_KEYS = ('personal', 'experience', 'education', 'skills')
+
+# Keys of the parser's experience and education entries, in column order
+EXPERIENCE_FIELDS = ('title', 'company', 'duration', 'location', 'description')
+EDUCATION_FIELDS = ('degree', 'institution', 'year', 'gpa')
+
+# Sections copied into JSON/Parquet exports, in order, with the factory for
+# their empty value
+EXPORT_SECTIONS = (
+    ('file_info', dict), ('overall_score', int), ('confidence_scores', dict),
+    ('personal_info', dict), ('summary', str),
+    ('experience', list), ('education', list), ('skills', list),
+)
+
+# Columns of the flattened CSV export, in output order
+CSV_FIELDS = (
+    'export_timestamp', 'filename', 'overall_score',
+    'name', 'email', 'phone', 'location', 'linkedin', 'summary',
+    *(f'confidence_{key}' for key in CONFIDENCE_KEYS),
+    'experience_index', 'job_title', 'company', 'job_duration', 'job_location', 'job_description',
+    'degree', 'institution', 'graduation_year', 'gpa',
+    'skills',
+)
+
 class DataExporter:
     """Export parsed resume data to various formats"""
     
@@ -24,6 +63,12 @@ class DataExporter:
             # Create a clean copy for export
             export_data = DataExporter._prepare_export_data(parsed_data)
             
+            if orjson is not None:
+                option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                return orjson.dumps(export_data, option=option).decode('utf-8')
+            
             if pretty:
                 return json.dumps(export_data, indent=2, ensure_ascii=False)
             else:
@@ -45,31 +90,45 @@ class DataExporter:
             str: CSV string
         """
         try:
-            # Flatten the data for CSV export
-            flattened_data = DataExporter._flatten_for_csv(parsed_data)
-            
-            # Create CSV in memory
-            output = io.StringIO()
-            
-            if flattened_data:
-                # Get all unique keys for CSV headers
-                all_keys = set()
-                for record in flattened_data:
-                    all_keys.update(record.keys())
-                
-                fieldnames = sorted(list(all_keys))
-                writer = csv.DictWriter(output, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                for record in flattened_data:
-                    writer.writerow(record)
-            
-            return output.getvalue()
+            return ''.join(DataExporter.iter_csv(parsed_data))
             
         except Exception as e:
             logging.error(f"Error exporting to CSV: {str(e)}")
             return "error,message\nExport Error,Failed to export data"
     
+    @staticmethod
+    def iter_csv(parsed_data):
+        """
+        Export parsed data to CSV format one line at a time
+        
+        Lets callers stream the CSV instead of building the whole document
+        in memory first.
+        
+        Args:
+            parsed_data (dict): Parsed resume data
+            
+        Yields:
+            str: The header line, then one line per flattened record
+        """
+        # The buffer only ever holds the line currently being written
+        line_buffer = io.StringIO()
+        writer = csv.writer(line_buffer)
+        
+        writer.writerow(CSV_FIELDS)
+        yield DataExporter._take_buffer(line_buffer)
+        
+        for row in DataExporter._csv_rows(parsed_data):
+            writer.writerow(row)
+            yield DataExporter._take_buffer(line_buffer)
+    
+    @staticmethod
+    def _take_buffer(buffer):
+        """Return the text written to a StringIO buffer and empty it for reuse"""
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return value
+    
     @staticmethod
     def to_excel(parsed_data):
         """
@@ -82,34 +141,14 @@ class DataExporter:
             bytes: Excel file bytes
         """
         try:
-            # Create Excel file in memory
             output = io.BytesIO()
+            sheets = DataExporter._excel_sheets(parsed_data)
             
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                # Personal Information Sheet
-                personal_df = DataExporter._create_personal_info_df(parsed_data)
-                personal_df.to_excel(writer, sheet_name='Personal Info', index=False)
-                
-                # Experience Sheet
-                experience_df = DataExporter._create_experience_df(parsed_data)
-                if not experience_df.empty:
-                    experience_df.to_excel(writer, sheet_name='Experience', index=False)
-                
-                # Education Sheet
-                education_df = DataExporter._create_education_df(parsed_data)
-                if not education_df.empty:
-                    education_df.to_excel(writer, sheet_name='Education', index=False)
-                
-                # Skills Sheet
-                skills_df = DataExporter._create_skills_df(parsed_data)
-                if not skills_df.empty:
-                    skills_df.to_excel(writer, sheet_name='Skills', index=False)
-                
-                # Summary Sheet
-                summary_df = DataExporter._create_summary_df(parsed_data)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+            if xlsxwriter is not None:
+                DataExporter._write_xlsxwriter_workbook(output, sheets)
+            else:
+                DataExporter._write_openpyxl_workbook(output, sheets)
             
-            output.seek(0)
             return output.getvalue()
             
         except Exception as e:
@@ -117,189 +156,255 @@ class DataExporter:
             return None
     
     @staticmethod
-    def _prepare_export_data(parsed_data):
-        """Prepare data for export by cleaning and organizing"""
-        export_data = {}
+    def to_excel_batch(parsed_resumes):
+        """
+        Export several parsed resumes into a single Excel workbook
         
-        # Add metadata
-        export_data['export_timestamp'] = datetime.now().isoformat()
-        export_data['file_info'] = parsed_data.get('file_info', {})
+        All resumes go on one sheet using the flattened CSV layout, so the
+        workbook is only set up once however many resumes are exported.
         
-        # Add scores
-        export_data['overall_score'] = parsed_data.get('overall_score', 0)
-        export_data['confidence_scores'] = parsed_data.get('confidence_scores', {})
+        Args:
+            parsed_resumes (list): Parsed resume data dicts
+            
+        Returns:
+            bytes: Excel file bytes
+        """
+        try:
+            output = io.BytesIO()
+            export_timestamp = datetime.now().isoformat()
+            rows = (
+                row
+                for parsed_data in parsed_resumes
+                for row in DataExporter._csv_rows(parsed_data, export_timestamp)
+            )
+            sheets = [('Resumes', CSV_FIELDS, rows)]
+            
+            if xlsxwriter is not None:
+                DataExporter._write_xlsxwriter_workbook(output, sheets)
+            else:
+                DataExporter._write_openpyxl_workbook(output, sheets)
+            
+            return output.getvalue()
+            
+        except Exception as e:
+            logging.error(f"Error exporting batch to Excel: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _write_xlsxwriter_workbook(output, sheets):
+        """
+        Write sheets with xlsxwriter in constant_memory mode
         
-        # Add extracted information
-        export_data['personal_info'] = parsed_data.get('personal_info', {})
-        export_data['summary'] = parsed_data.get('summary', '')
-        export_data['experience'] = parsed_data.get('experience', [])
-        export_data['education'] = parsed_data.get('education', [])
-        export_data['skills'] = parsed_data.get('skills', [])
+        Rows are flushed as soon as they are written, which works because every
+        sheet is written top to bottom before the next one starts.
+        """
+        workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+        header_format = workbook.add_format({'bold': True})
         
-        # Don't include raw text in export by default
-        # export_data['raw_text'] = parsed_data.get('raw_text', '')
+        for sheet_name, headers, rows in sheets:
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, headers, header_format)
+            for row_number, row in enumerate(rows, start=1):
+                worksheet.write_row(row_number, 0, row)
         
-        return export_data
+        workbook.close()
     
     @staticmethod
-    def _flatten_for_csv(parsed_data):
-        """Flatten nested data structure for CSV export"""
-        flattened_records = []
-        
-        # Base record with personal info and scores
-        base_record = {
-            'export_timestamp': datetime.now().isoformat(),
-            'filename': parsed_data.get('file_info', {}).get('filename', ''),
-            'overall_score': parsed_data.get('overall_score', 0),
-            'name': parsed_data.get('personal_info', {}).get('name', ''),
-            'email': parsed_data.get('personal_info', {}).get('email', ''),
-            'phone': parsed_data.get('personal_info', {}).get('phone', ''),
-            'location': parsed_data.get('personal_info', {}).get('location', ''),
-            'linkedin': parsed_data.get('personal_info', {}).get('linkedin', ''),
-            'summary': parsed_data.get('summary', ''),
-        }
-        
-        # Add confidence scores
-        confidence_scores = parsed_data.get('confidence_scores', {})
-        for key, value in confidence_scores.items():
-            base_record[f'confidence_{key}'] = value
+    def _write_openpyxl_workbook(output, sheets):
+        """Write sheets by streaming rows into a write-only openpyxl workbook"""
+        workbook = Workbook(write_only=True)
+        header_font = Font(bold=True)
         
-        # If there's experience data, create records for each job
-        experience = parsed_data.get('experience', [])
-        if experience:
-            for i, exp in enumerate(experience):
-                record = base_record.copy()
-                record.update({
-                    'experience_index': i + 1,
-                    'job_title': exp.get('title', ''),
-                    'company': exp.get('company', ''),
-                    'job_duration': exp.get('duration', ''),
-                    'job_location': exp.get('location', ''),
-                    'job_description': exp.get('description', ''),
-                })
-                flattened_records.append(record)
-        else:
-            # If no experience, just add the base record
-            flattened_records.append(base_record)
-        
-        # Add education data to the first record or create separate records
-        education = parsed_data.get('education', [])
-        if education and flattened_records:
-            for i, edu in enumerate(education):
-                if i < len(flattened_records):
-                    flattened_records[i].update({
-                        'degree': edu.get('degree', ''),
-                        'institution': edu.get('institution', ''),
-                        'graduation_year': edu.get('year', ''),
-                        'gpa': edu.get('gpa', ''),
-                    })
-        
-        # Add skills as a comma-separated list
-        skills = parsed_data.get('skills', [])
-        if skills and flattened_records:
-            skill_names = []
-            for skill in skills:
-                if isinstance(skill, dict):
-                    skill_names.append(skill.get('name', ''))
-                else:
-                    skill_names.append(str(skill))
+        for sheet_name, headers, rows in sheets:
+            worksheet = workbook.create_sheet(title=sheet_name)
+            
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(worksheet, value=header)
+                cell.font = header_font
+                header_cells.append(cell)
+            worksheet.append(header_cells)
             
-            skills_text = ', '.join(filter(None, skill_names))
-            flattened_records[0]['skills'] = skills_text
+            for row in rows:
+                worksheet.append(row)
         
-        return flattened_records
+        workbook.save(output)
     
     @staticmethod
-    def _create_personal_info_df(parsed_data):
-        """Create DataFrame for personal information"""
-        personal_info = parsed_data.get('personal_info', {})
+    def to_parquet(parsed_data):
+        """
+        Export parsed data to Parquet format
         
-        data = [{
-            'Field': key.replace('_', ' ').title(),
-            'Value': value
-        } for key, value in personal_info.items()]
+        The nested resume structure is kept as Arrow structs and lists, and
+        the file is zstd compressed.
         
-        # Add scores
-        data.append({'Field': 'Overall Score', 'Value': parsed_data.get('overall_score', 0)})
-        
-        confidence_scores = parsed_data.get('confidence_scores', {})
-        for key, value in confidence_scores.items():
-            data.append({'Field': f'Confidence - {key.title()}', 'Value': f'{value}%'})
+        Args:
+            parsed_data (dict or list): Parsed resume data, or a list of them for a bulk export
+            
+        Returns:
+            bytes: Parquet file bytes
+        """
+        try:
+            records = parsed_data if isinstance(parsed_data, list) else [parsed_data]
+            export_timestamp = datetime.now().isoformat()
+            table = pa.Table.from_pylist([
+                DataExporter._prepare_export_data(record, export_timestamp) for record in records
+            ])
+            
+            output = io.BytesIO()
+            pq.write_table(table, output, compression='zstd')
+            return output.getvalue()
+            
+        except Exception as e:
+            logging.error(f"Error exporting to Parquet: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _prepare_export_data(parsed_data, export_timestamp=None):
+        """
+        Prepare data for export by cleaning and organizing
         
-        return pd.DataFrame(data)
+        Only the EXPORT_SECTIONS are kept (raw text is left out by default);
+        missing sections get an empty value so every export has the same keys.
+        """
+        export_data = {'export_timestamp': export_timestamp or datetime.now().isoformat()}
+        export_data.update(
+            (key, parsed_data[key] if key in parsed_data else empty())
+            for key, empty in EXPORT_SECTIONS
+        )
+        return export_data
     
     @staticmethod
-    def _create_experience_df(parsed_data):
-        """Create DataFrame for work experience"""
+    def _csv_rows(parsed_data, export_timestamp=None):
+        """
+        Flatten nested data into CSV rows, with values in CSV_FIELDS order
+        
+        There is one row per job (or a single row without any experience);
+        education entries fill the rows in order and the skills list goes on
+        the first row.
+        
+        Args:
+            parsed_data (dict): Parsed resume data
+            export_timestamp (str): ISO timestamp for the rows; pass one in to
+                share it across several resumes, defaults to now
+        """
+        if export_timestamp is None:
+            export_timestamp = datetime.now().isoformat()
+        
+        personal_info = parsed_data.get('personal_info', {})
+        confidence_scores = parsed_data.get('confidence_scores', {})
         experience = parsed_data.get('experience', [])
+        education = parsed_data.get('education', [])
+        skills = parsed_data.get('skills', [])
+        
+        # Base columns with personal info and scores, repeated on every row
+        base_row = (
+            export_timestamp,
+            parsed_data.get('file_info', {}).get('filename', ''),
+            parsed_data.get('overall_score', 0),
+            personal_info.get('name', ''),
+            personal_info.get('email', ''),
+            personal_info.get('phone', ''),
+            personal_info.get('location', ''),
+            personal_info.get('linkedin', ''),
+            parsed_data.get('summary', ''),
+        ) + tuple(confidence_scores.get(key, '') for key in CONFIDENCE_KEYS)
         
-        if not experience:
-            return pd.DataFrame()
+        # Skills as a comma-separated list
+        skill_names = (skill.get('name', '') if isinstance(skill, dict) else str(skill) for skill in skills)
+        skills_text = ', '.join(filter(None, skill_names))
         
-        return pd.DataFrame(experience)
+        no_experience = ('',) * (len(EXPERIENCE_FIELDS) + 1)
+        no_education = ('',) * len(EDUCATION_FIELDS)
+        
+        education_count = len(education)
+        
+        for i in range(max(len(experience), 1)):
+            if experience:
+                exp_get = experience[i].get
+                experience_columns = (i + 1,) + tuple(exp_get(field, '') for field in EXPERIENCE_FIELDS)
+            else:
+                experience_columns = no_experience
+            
+            if i < education_count:
+                edu_get = education[i].get
+                education_columns = tuple(edu_get(field, '') for field in EDUCATION_FIELDS)
+            else:
+                education_columns = no_education
+            
+            yield base_row + experience_columns + education_columns + (skills_text if i == 0 else '',)
     
     @staticmethod
-    def _create_education_df(parsed_data):
-        """Create DataFrame for education"""
+    def _excel_sheets(parsed_data):
+        """
+        Yield the sheets of the Excel export in workbook order
+        
+        Empty experience, education and skills sheets are left out.
+        
+        Args:
+            parsed_data (dict): Parsed resume data
+            
+        Yields:
+            tuple: (sheet name, header row, iterable of data rows)
+        """
+        yield ('Personal Info', ('Field', 'Value'), DataExporter._personal_info_rows(parsed_data))
+        
+        experience = parsed_data.get('experience', [])
+        if experience:
+            yield ('Experience', EXPERIENCE_FIELDS, DataExporter._record_rows(experience, EXPERIENCE_FIELDS))
+        
         education = parsed_data.get('education', [])
+        if education:
+            yield ('Education', EDUCATION_FIELDS, DataExporter._record_rows(education, EDUCATION_FIELDS))
         
-        if not education:
-            return pd.DataFrame()
+        skills = parsed_data.get('skills', [])
+        if skills:
+            yield ('Skills', ('Skill', 'Category'), DataExporter._skills_rows(skills))
         
-        return pd.DataFrame(education)
+        yield ('Summary', ('Category', 'Field', 'Value'), DataExporter._summary_rows(parsed_data))
     
     @staticmethod
-    def _create_skills_df(parsed_data):
-        """Create DataFrame for skills"""
-        skills = parsed_data.get('skills', [])
+    def _personal_info_rows(parsed_data):
+        """Rows for the personal information sheet"""
+        personal_info = parsed_data.get('personal_info', {})
+        confidence_scores = parsed_data.get('confidence_scores', {})
         
-        if not skills:
-            return pd.DataFrame()
+        for key, value in personal_info.items():
+            yield (key.replace('_', ' ').title(), value)
         
-        # Normalize skills data
-        skills_data = []
+        # Add scores
+        yield ('Overall Score', parsed_data.get('overall_score', 0))
+        for key, value in confidence_scores.items():
+            yield (f'Confidence - {key.title()}', f'{value}%')
+    
+    @staticmethod
+    def _record_rows(records, fields):
+        """Rows for a list of dicts (experience, education) with the given columns"""
+        for record in records:
+            yield tuple(record.get(field) for field in fields)
+    
+    @staticmethod
+    def _skills_rows(skills):
+        """Rows for the skills sheet"""
         for skill in skills:
             if isinstance(skill, dict):
-                skills_data.append({
-                    'Skill': skill.get('name', ''),
-                    'Category': skill.get('category', 'General')
-                })
+                yield (skill.get('name', ''), skill.get('category', 'General'))
             else:
-                skills_data.append({
-                    'Skill': str(skill),
-                    'Category': 'General'
-                })
-        
-        return pd.DataFrame(skills_data)
+                yield (str(skill), 'General')
     
     @staticmethod
-    def _create_summary_df(parsed_data):
-        """Create DataFrame for summary information"""
-        summary_data = []
-        
+    def _summary_rows(parsed_data):
+        """Rows for the summary sheet"""
         # File information
-        file_info = parsed_data.get('file_info', {})
-        for key, value in file_info.items():
-            summary_data.append({
-                'Category': 'File Info',
-                'Field': key.replace('_', ' ').title(),
-                'Value': value
-            })
+        for key, value in parsed_data.get('file_info', {}).items():
+            yield ('File Info', key.replace('_', ' ').title(), value)
         
         # Summary text
         summary_text = parsed_data.get('summary', '')
         if summary_text:
-            summary_data.append({
-                'Category': 'Professional Summary',
-                'Field': 'Summary',
-                'Value': summary_text
-            })
+            yield ('Professional Summary', 'Summary', summary_text)
         
         # Counts
-        summary_data.extend([
-            {'Category': 'Statistics', 'Field': 'Experience Entries', 'Value': len(parsed_data.get('experience', []))},
-            {'Category': 'Statistics', 'Field': 'Education Entries', 'Value': len(parsed_data.get('education', []))},
-            {'Category': 'Statistics', 'Field': 'Skills Count', 'Value': len(parsed_data.get('skills', []))},
-        ])
-        
-        return pd.DataFrame(summary_data)
+        yield ('Statistics', 'Experience Entries', len(parsed_data.get('experience', [])))
+        yield ('Statistics', 'Education Entries', len(parsed_data.get('education', [])))
+        yield ('Statistics', 'Skills Count', len(parsed_data.get('skills', [])))
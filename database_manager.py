@@ -1,16 +1,29 @@
 import os
 import json
-from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Float, Boolean
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, inspect, insert, select, delete, text, func, tuple_, Column, ForeignKey, Index, Integer, String, Text, DateTime, Float, Boolean, JSON
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
 import logging
+from contextlib import contextmanager
 from config import get_database_config
 
+try:
+    import orjson  # optional, faster (de)serialization of the JSON columns
+except ImportError:
+    orjson = None
+
 Base = declarative_base()
 
+# Native JSON storage: JSONB on PostgreSQL, SQLite's JSON (text) elsewhere
+JSONData = JSON().with_variant(JSONB(), 'postgresql').with_variant(SQLiteJSON(), 'sqlite')
+
+# Columns that search_resumes() can filter on; on PostgreSQL each one gets a
+# pg_trgm GIN index so that ILIKE '%term%' does not need a full table scan
+SEARCHABLE_FIELDS = ('candidate_name', 'email', 'location', 'filename')
+
 class ParsedResume(Base):
     """Database model for storing parsed resume data"""
     __tablename__ = 'parsed_resumes'
@@ -18,13 +31,14 @@ class ParsedResume(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     filename = Column(String(255), nullable=False)
     upload_timestamp = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64), index=True)  # blake2b of the uploaded file
     
     # Personal Information
     candidate_name = Column(String(255))
-    email = Column(String(255))
-    phone = Column(String(50))
+    email = Column(String(320))  # RFC 5321 maximum
+    phone = Column(String(32))
     location = Column(String(255))
-    linkedin = Column(String(255))
+    linkedin = Column(String(512))
     
     # Summary
     professional_summary = Column(Text)
@@ -36,40 +50,128 @@ class ParsedResume(Base):
     skills_confidence = Column(Float, default=0.0)
     personal_confidence = Column(Float, default=0.0)
     
-    # Structured data as JSON (compatible with both PostgreSQL and SQLite)
-    experience_data = Column(Text)  # Store as JSON string for SQLite compatibility
-    education_data = Column(Text)   # Store as JSON string for SQLite compatibility
-    skills_data = Column(Text)      # Store as JSON string for SQLite compatibility
+    # Structured data as JSON, decoded by the driver on load
+    experience_data = Column(JSONData)
+    education_data = Column(JSONData)
+    skills_data = Column(JSONData)
     
     # File metadata
     file_size = Column(Integer)
     text_length = Column(Integer)
     
-    # Processing metadata
+    # Processing metadata (failed uploads are kept in parsed_resume_errors;
+    # rows saved as failures by earlier versions still carry False here)
     processing_time_seconds = Column(Float)
-    is_processed_successfully = Column(Boolean, default=True)
-    error_message = Column(Text)
+    is_processed_successfully = Column(Boolean, nullable=False, default=True)
+    
+    __table_args__ = (
+        # Supports the dashboard's recent-upload and success-rate aggregates
+        Index('ix_parsed_resumes_upload_status', 'upload_timestamp', 'is_processed_successfully'),
+        # Containment queries on skills (skills_data @> '[{"name": "python"}]'), PostgreSQL only
+        Index('ix_parsed_resumes_skills_gin', 'skills_data',
+              postgresql_using='gin', postgresql_ops={'skills_data': 'jsonb_path_ops'}).ddl_if(dialect='postgresql'),
+    )
     
     def get_experience_data(self):
-        """Parse experience data from JSON string"""
-        try:
-            return json.loads(self.experience_data) if self.experience_data else []
-        except (json.JSONDecodeError, TypeError):
-            return []
+        """Get the stored experience entries"""
+        return _decode_json_data(self.experience_data)
     
     def get_education_data(self):
-        """Parse education data from JSON string"""
-        try:
-            return json.loads(self.education_data) if self.education_data else []
-        except (json.JSONDecodeError, TypeError):
-            return []
+        """Get the stored education entries"""
+        return _decode_json_data(self.education_data)
     
     def get_skills_data(self):
-        """Parse skills data from JSON string"""
+        """Get the stored skills"""
+        return _decode_json_data(self.skills_data)
+    
+    def to_parsed_data(self):
+        """Rebuild the parser's output structure from the stored record"""
+        personal_info = {
+            'name': self.candidate_name,
+            'email': self.email,
+            'phone': self.phone,
+            'location': self.location,
+            'linkedin': self.linkedin
+        }
+        
+        return {
+            'personal_info': {key: value for key, value in personal_info.items() if value},
+            'summary': self.professional_summary,
+            'experience': self.get_experience_data(),
+            'education': self.get_education_data(),
+            'skills': self.get_skills_data(),
+            'file_info': {
+                'filename': self.filename,
+                'file_size': self.file_size,
+                'text_length': self.text_length
+            },
+            'overall_score': self.overall_score,
+            'confidence_scores': {
+                'personal': self.personal_confidence,
+                'experience': self.experience_confidence,
+                'education': self.education_confidence,
+                'skills': self.skills_confidence
+            }
+        }
+
+class ParsedResumeError(Base):
+    """Uploads that could not be parsed, kept apart from the parsed_resumes rows"""
+    __tablename__ = 'parsed_resume_errors'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    filename = Column(String(255), nullable=False)
+    file_size = Column(Integer)
+    upload_timestamp = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    error_message = Column(Text)
+
+class ResumeSkill(Base):
+    """Skill names of each stored resume, one row per skill, for indexed skill lookups"""
+    __tablename__ = 'resume_skills'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    resume_id = Column(Integer, ForeignKey('parsed_resumes.id', ondelete='CASCADE'), nullable=False, index=True)
+    skill_name = Column(String(255), nullable=False, index=True)  # lowercased
+    category = Column(String(100))
+
+def _skill_rows(resume_id, skills):
+    """Build resume_skills rows for a resume's parsed skills"""
+    rows = []
+    for skill in skills:
+        if isinstance(skill, dict):
+            name, category = skill.get('name', ''), skill.get('category', 'General')
+        else:
+            name, category = str(skill), 'General'
+        if name:
+            rows.append({'resume_id': resume_id, 'skill_name': name.lower(), 'category': category})
+    return rows
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Connect hook for SQLite: write-ahead logging lets readers run while a
+    resume is being saved, and NORMAL sync is safe under WAL
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+def _decode_json_data(value):
+    """
+    Return a JSON column's value as a list
+    
+    Rows in PostgreSQL tables whose columns were created as TEXT (before the
+    schema upgrade converts them) come back as JSON strings.
+    """
+    if isinstance(value, str):
         try:
-            return json.loads(self.skills_data) if self.skills_data else []
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(value) if orjson is not None else json.loads(value)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
             return []
+    return value or []
+
+def _orjson_dumps(value):
+    """JSON column serializer; SQLAlchemy expects a str"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
 
 class DatabaseManager:
     """Database manager for resume parsing application"""
@@ -87,17 +189,25 @@ class DatabaseManager:
             database_url = db_config['url']
             
             # Create engine with appropriate settings
+            engine_kwargs = dict(db_config['engine_kwargs'])
+            if orjson is not None:
+                engine_kwargs.update(json_serializer=_orjson_dumps, json_deserializer=orjson.loads)
+            self.engine = create_engine(database_url, **engine_kwargs)
             if db_config['type'] == 'sqlite':
-                self.engine = create_engine(database_url, echo=False)
+                event.listen(self.engine, 'connect', _set_sqlite_pragmas)
                 self.logger.info("Using SQLite database for local development")
             else:
-                self.engine = create_engine(database_url, echo=False)
                 self.logger.info("Using PostgreSQL database")
             
-            self.Session = sessionmaker(bind=self.engine)
+            # One reusable session per thread (each Streamlit session runs in its own)
+            self.Session = scoped_session(sessionmaker(bind=self.engine, expire_on_commit=False))
             
             # Create tables
+            new_tables = set(Base.metadata.tables) - set(inspect(self.engine).get_table_names())
             Base.metadata.create_all(self.engine)
+            self._upgrade_schema()
+            if ResumeSkill.__tablename__ in new_tables and ParsedResume.__tablename__ not in new_tables:
+                self._backfill_resume_skills()
             self.logger.info("Database initialized successfully")
             return True
             
@@ -105,7 +215,136 @@ class DatabaseManager:
             self.logger.error(f"Database initialization failed: {str(e)}")
             return False
     
-    def save_parsed_resume(self, parsed_data, filename, processing_time=None):
+    @contextmanager
+    def _session(self):
+        """
+        Provide this thread's scoped session for one unit of work
+        
+        Rolls back if the block raises. Closing at the end hands the connection
+        back to the engine's pool; the Session object itself stays registered
+        for the thread and is reused by the next call.
+        """
+        session = self.Session()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def _upgrade_schema(self):
+        """
+        Add columns and indexes introduced after the tables were first created
+        
+        create_all() only creates missing tables, so databases created by an
+        earlier version would otherwise lack newer (nullable) columns.
+        """
+        inspector = inspect(self.engine)
+        
+        for table in Base.metadata.sorted_tables:
+            existing_columns = {column['name']: column['type'] for column in inspector.get_columns(table.name)}
+            
+            for column in table.columns:
+                if column.name in existing_columns:
+                    if self.engine.dialect.name == 'postgresql':
+                        self._convert_text_to_jsonb(table, column, existing_columns[column.name])
+                        self._widen_string_column(table, column, existing_columns[column.name])
+                    continue
+                
+                column_type = column.type.compile(dialect=self.engine.dialect)
+                with self.engine.begin() as connection:
+                    connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                self.logger.info(f"Added column {table.name}.{column.name}")
+            
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        
+        if self.engine.dialect.name == 'postgresql':
+            self._create_trigram_indexes()
+            self._set_json_column_compression()
+    
+    def _backfill_resume_skills(self):
+        """Fill the resume_skills table for resumes stored before it existed"""
+        with self._session() as session:
+            resumes = session.execute(select(ParsedResume.id, ParsedResume.skills_data)).all()
+            skill_rows = [
+                row
+                for resume_id, skills_data in resumes
+                for row in _skill_rows(resume_id, _decode_json_data(skills_data))
+            ]
+            if skill_rows:
+                session.execute(insert(ResumeSkill.__table__), skill_rows)
+                session.commit()
+            self.logger.info(f"Indexed {len(skill_rows)} skills of existing resumes")
+    
+    def _convert_text_to_jsonb(self, table, column, existing_type):
+        """Convert a JSON column still stored as TEXT by an earlier version to JSONB"""
+        if not isinstance(column.type, JSON) or not isinstance(existing_type, Text):
+            return
+        
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                f'ALTER TABLE {table.name} ALTER COLUMN {column.name} TYPE JSONB USING {column.name}::jsonb'
+            ))
+        self.logger.info(f"Converted {table.name}.{column.name} to JSONB")
+    
+    def _widen_string_column(self, table, column, existing_type):
+        """
+        Widen a VARCHAR column created shorter by an earlier version
+        
+        Columns are never narrowed, since existing values might not fit.
+        """
+        if not isinstance(column.type, String) or not isinstance(existing_type, String):
+            return
+        if not column.type.length or not existing_type.length or column.type.length <= existing_type.length:
+            return
+        
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                f'ALTER TABLE {table.name} ALTER COLUMN {column.name} TYPE VARCHAR({column.type.length})'
+            ))
+        self.logger.info(f"Widened {table.name}.{column.name} to VARCHAR({column.type.length})")
+    
+    def _set_json_column_compression(self):
+        """
+        Compress the JSON columns with lz4 instead of pglz (PostgreSQL 14+)
+        
+        Only applies to values written afterwards; servers without lz4
+        support keep the default compression.
+        """
+        json_columns = [column.name for column in ParsedResume.__table__.columns if isinstance(column.type, JSON)]
+        try:
+            with self.engine.begin() as connection:
+                uncompressed = connection.execute(text(
+                    "SELECT attname FROM pg_attribute "
+                    "WHERE attrelid = CAST(:table AS regclass) AND attname = ANY(:columns) AND attcompression <> 'l'"
+                ), {'table': ParsedResume.__tablename__, 'columns': json_columns}).scalars().all()
+                
+                for column_name in uncompressed:
+                    connection.execute(text(
+                        f'ALTER TABLE {ParsedResume.__tablename__} ALTER COLUMN {column_name} SET COMPRESSION lz4'
+                    ))
+                    self.logger.info(f"Enabled lz4 compression for {ParsedResume.__tablename__}.{column_name}")
+        except Exception as e:
+            self.logger.warning(f"Could not enable lz4 column compression: {str(e)}")
+    
+    def _create_trigram_indexes(self):
+        """Create pg_trgm GIN indexes backing the ILIKE searches (PostgreSQL only)"""
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+                for field in SEARCHABLE_FIELDS:
+                    connection.execute(text(
+                        f'CREATE INDEX IF NOT EXISTS ix_{ParsedResume.__tablename__}_{field}_trgm '
+                        f'ON {ParsedResume.__tablename__} USING gin ({field} gin_trgm_ops)'
+                    ))
+        except Exception as e:
+            # Creating the extension needs elevated privileges on some hosts;
+            # searching still works, just without index support
+            self.logger.warning(f"Could not create trigram search indexes: {str(e)}")
+    
+    def save_parsed_resume(self, parsed_data, filename, processing_time=None, content_hash=None):
         """
         Save parsed resume data to database
         
@@ -113,6 +352,7 @@ class DatabaseManager:
             parsed_data (dict): Parsed resume data
             filename (str): Original filename
             processing_time (float): Processing time in seconds
+            content_hash (str): Hash of the uploaded file contents
             
         Returns:
             int: ID of saved record, None if failed
@@ -121,49 +361,104 @@ class DatabaseManager:
             self.logger.error("Database not initialized")
             return None
         
-        session = self.Session()
         try:
-            # Extract personal information
-            personal_info = parsed_data.get('personal_info', {})
-            confidence_scores = parsed_data.get('confidence_scores', {})
-            file_info = parsed_data.get('file_info', {})
-            
-            # Create database record
-            resume_record = ParsedResume(
-                filename=filename,
-                candidate_name=personal_info.get('name'),
-                email=personal_info.get('email'),
-                phone=personal_info.get('phone'),
-                location=personal_info.get('location'),
-                linkedin=personal_info.get('linkedin'),
-                professional_summary=parsed_data.get('summary'),
-                overall_score=parsed_data.get('overall_score', 0),
-                experience_confidence=confidence_scores.get('experience', 0.0),
-                education_confidence=confidence_scores.get('education', 0.0),
-                skills_confidence=confidence_scores.get('skills', 0.0),
-                personal_confidence=confidence_scores.get('personal', 0.0),
-                experience_data=json.dumps(parsed_data.get('experience', [])),
-                education_data=json.dumps(parsed_data.get('education', [])),
-                skills_data=json.dumps(parsed_data.get('skills', [])),
-                file_size=file_info.get('file_size'),
-                text_length=file_info.get('text_length'),
-                processing_time_seconds=processing_time,
-                is_processed_successfully=True
-            )
-            
-            session.add(resume_record)
-            session.commit()
-            
-            record_id = resume_record.id
-            self.logger.info(f"Resume data saved successfully with ID: {record_id}")
-            return record_id
+            with self._session() as session:
+                values = self._build_resume_values(parsed_data, filename, processing_time, content_hash)
+                resume_record = ParsedResume(**values)
+                
+                session.add(resume_record)
+                session.flush()
+                
+                skill_rows = _skill_rows(resume_record.id, values['skills_data'])
+                if skill_rows:
+                    session.execute(insert(ResumeSkill.__table__), skill_rows)
+                session.commit()
+                
+                record_id = resume_record.id
+                self.logger.info(f"Resume data saved successfully with ID: {record_id}")
+                return record_id
             
         except Exception as e:
-            session.rollback()
             self.logger.error(f"Error saving resume data: {str(e)}")
             return None
-        finally:
-            session.close()
+    
+    def save_parsed_resumes_bulk(self, records):
+        """
+        Save several parsed resumes in a single transaction
+        
+        If the batch insert fails, each record is retried on its own so one
+        bad record does not lose the rest of the batch.
+        
+        Args:
+            records (list): (parsed_data, filename, processing_time, content_hash) tuples
+            
+        Returns:
+            list: ID of each saved record, None for records that failed
+        """
+        if not records:
+            return []
+        
+        if not self.Session:
+            self.logger.error("Database not initialized")
+            return [None] * len(records)
+        
+        try:
+            with self._session() as session:
+                rows = [self._build_resume_values(*record) for record in records]
+                
+                # One Core executemany INSERT, bypassing the ORM unit of work; the
+                # generated IDs come back via RETURNING in the order of the rows
+                statement = insert(ParsedResume.__table__).returning(
+                    ParsedResume.__table__.c.id, sort_by_parameter_order=True
+                )
+                record_ids = session.execute(statement, rows).scalars().all()
+                
+                skill_rows = [
+                    row
+                    for record_id, values in zip(record_ids, rows)
+                    for row in _skill_rows(record_id, values['skills_data'])
+                ]
+                if skill_rows:
+                    session.execute(insert(ResumeSkill.__table__), skill_rows)
+                session.commit()
+                
+                self.logger.info(f"Saved {len(record_ids)} resumes in one batch")
+                return record_ids
+            
+        except Exception as e:
+            self.logger.warning(f"Batch save failed, saving resumes one by one: {str(e)}")
+        
+        return [self.save_parsed_resume(*record) for record in records]
+    
+    def _build_resume_values(self, parsed_data, filename, processing_time=None, content_hash=None):
+        """Map parsed resume data to ParsedResume column values"""
+        # Look up each nested section once; 'or' also covers sections stored as None
+        personal_info = parsed_data.get('personal_info') or {}
+        confidence_scores = parsed_data.get('confidence_scores') or {}
+        file_info = parsed_data.get('file_info') or {}
+        
+        return dict(
+            filename=filename,
+            content_hash=content_hash,
+            candidate_name=personal_info.get('name'),
+            email=personal_info.get('email'),
+            phone=personal_info.get('phone'),
+            location=personal_info.get('location'),
+            linkedin=personal_info.get('linkedin'),
+            professional_summary=parsed_data.get('summary'),
+            overall_score=parsed_data.get('overall_score', 0),
+            experience_confidence=confidence_scores.get('experience', 0.0),
+            education_confidence=confidence_scores.get('education', 0.0),
+            skills_confidence=confidence_scores.get('skills', 0.0),
+            personal_confidence=confidence_scores.get('personal', 0.0),
+            experience_data=parsed_data.get('experience') or [],
+            education_data=parsed_data.get('education') or [],
+            skills_data=parsed_data.get('skills') or [],
+            file_size=file_info.get('file_size'),
+            text_length=file_info.get('text_length'),
+            processing_time_seconds=processing_time,
+            is_processed_successfully=True
+        )
     
     def save_error_record(self, filename, error_message, file_size=None):
         """
@@ -180,28 +475,24 @@ class DatabaseManager:
         if not self.Session:
             return None
         
-        session = self.Session()
         try:
-            error_record = ParsedResume(
-                filename=filename,
-                file_size=file_size,
-                is_processed_successfully=False,
-                error_message=error_message
-            )
-            
-            session.add(error_record)
-            session.commit()
-            
-            record_id = error_record.id
-            self.logger.info(f"Error record saved with ID: {record_id}")
-            return record_id
+            with self._session() as session:
+                error_record = ParsedResumeError(
+                    filename=filename,
+                    file_size=file_size,
+                    error_message=error_message
+                )
+                
+                session.add(error_record)
+                session.commit()
+                
+                record_id = error_record.id
+                self.logger.info(f"Error record saved with ID: {record_id}")
+                return record_id
             
         except Exception as e:
-            session.rollback()
             self.logger.error(f"Error saving error record: {str(e)}")
             return None
-        finally:
-            session.close()
     
     def get_all_resumes(self, limit=100, offset=0):
         """
@@ -217,21 +508,118 @@ class DatabaseManager:
         if not self.Session:
             return []
         
-        session = self.Session()
         try:
-            resumes = session.query(ParsedResume)\
-                           .order_by(ParsedResume.upload_timestamp.desc())\
-                           .limit(limit)\
-                           .offset(offset)\
-                           .all()
-            
-            return resumes
+            with self._session() as session:
+                resumes = session.query(ParsedResume)\
+                               .order_by(ParsedResume.upload_timestamp.desc())\
+                               .limit(limit)\
+                               .offset(offset)\
+                               .all()
+                
+                return resumes
             
         except Exception as e:
             self.logger.error(f"Error retrieving resumes: {str(e)}")
             return []
-        finally:
-            session.close()
+    
+    def stream_resumes(self, batch_size=500, successful_only=False):
+        """
+        Iterate over all parsed resumes, newest first, one batch at a time
+        
+        Batches are paged with a keyset on (upload_timestamp, id) instead of
+        OFFSET, and each one is fetched in its own short session so nothing
+        stays checked out while the caller consumes the records.
+        
+        Args:
+            batch_size (int): Number of records fetched per query
+            successful_only (bool): Skip records of failed parses
+            
+        Yields:
+            ParsedResume: Resume records
+        """
+        if not self.Session:
+            return
+        
+        order = (ParsedResume.upload_timestamp.desc(), ParsedResume.id.desc())
+        last_key = None
+        
+        while True:
+            query = select(ParsedResume).order_by(*order).limit(batch_size)
+            if successful_only:
+                query = query.where(ParsedResume.is_processed_successfully.is_(True))
+            if last_key is not None:
+                query = query.where(tuple_(ParsedResume.upload_timestamp, ParsedResume.id) < last_key)
+            
+            try:
+                with self._session() as session:
+                    batch = session.execute(query).scalars().all()
+            except Exception as e:
+                self.logger.error(f"Error streaming resumes: {str(e)}")
+                return
+            
+            yield from batch
+            
+            if len(batch) < batch_size:
+                return
+            last_key = (batch[-1].upload_timestamp, batch[-1].id)
+    
+    def list_resumes_summary(self, limit=50):
+        """
+        Retrieve the columns needed for resume listings, newest first
+        
+        Only the listed columns are selected, so no ORM objects are built.
+        
+        Args:
+            limit (int): Maximum number of records to return
+            
+        Returns:
+            list: Rows of (id, candidate_name, filename, email, overall_score,
+                  upload_timestamp)
+        """
+        if not self.Session:
+            return []
+        
+        try:
+            with self._session() as session:
+                rows = session.execute(
+                    select(
+                        ParsedResume.id,
+                        ParsedResume.candidate_name,
+                        ParsedResume.filename,
+                        ParsedResume.email,
+                        ParsedResume.overall_score,
+                        ParsedResume.upload_timestamp
+                    )
+                    .order_by(ParsedResume.upload_timestamp.desc())
+                    .limit(limit)
+                ).all()
+                
+                return rows
+            
+        except Exception as e:
+            self.logger.error(f"Error retrieving resume summaries: {str(e)}")
+            return []
+    
+    def get_latest_resume_id(self):
+        """
+        Get the ID of the newest successfully parsed resume
+        
+        Returns:
+            int: Resume record ID, or None if there are none
+        """
+        if not self.Session:
+            return None
+        
+        try:
+            with self._session() as session:
+                return session.execute(
+                    select(func.max(ParsedResume.id))
+                    .where(ParsedResume.is_processed_successfully.is_(True))
+                ).scalar()
+            
+        except Exception as e:
+            self.logger.error(f"Error retrieving latest resume ID: {str(e)}")
+            return None
     
     def get_resume_by_id(self, resume_id):
         """
@@ -246,16 +634,40 @@ class DatabaseManager:
         if not self.Session:
             return None
         
-        session = self.Session()
         try:
-            resume = session.query(ParsedResume).filter(ParsedResume.id == resume_id).first()
-            return resume
+            with self._session() as session:
+                resume = session.query(ParsedResume).filter(ParsedResume.id == resume_id).first()
+                return resume
             
         except Exception as e:
             self.logger.error(f"Error retrieving resume {resume_id}: {str(e)}")
             return None
-        finally:
-            session.close()
+    
+    def get_resume_by_content_hash(self, content_hash):
+        """
+        Get the most recent successfully parsed resume with the given file contents
+        
+        Args:
+            content_hash (str): Hash of the uploaded file contents
+            
+        Returns:
+            ParsedResume: Resume record or None
+        """
+        if not self.Session:
+            return None
+        
+        try:
+            with self._session() as session:
+                resume = session.query(ParsedResume)\
+                              .filter(ParsedResume.content_hash == content_hash,
+                                      ParsedResume.is_processed_successfully == True)\
+                              .order_by(ParsedResume.upload_timestamp.desc())\
+                              .first()
+                return resume
+            
+        except Exception as e:
+            self.logger.error(f"Error retrieving resume by content hash: {str(e)}")
+            return None
     
     def search_resumes(self, search_term, search_field='candidate_name'):
         """
@@ -263,7 +675,7 @@ class DatabaseManager:
         
         Args:
             search_term (str): Term to search for
-            search_field (str): Field to search in
+            search_field (str): Field to search in, or 'skill' for an exact skill name
             
         Returns:
             list: Matching resume records
@@ -271,27 +683,24 @@ class DatabaseManager:
         if not self.Session:
             return []
         
-        session = self.Session()
         try:
-            query = session.query(ParsedResume)
-            
-            if search_field == 'candidate_name':
-                query = query.filter(ParsedResume.candidate_name.ilike(f'%{search_term}%'))
-            elif search_field == 'email':
-                query = query.filter(ParsedResume.email.ilike(f'%{search_term}%'))
-            elif search_field == 'location':
-                query = query.filter(ParsedResume.location.ilike(f'%{search_term}%'))
-            elif search_field == 'filename':
-                query = query.filter(ParsedResume.filename.ilike(f'%{search_term}%'))
-            
-            resumes = query.order_by(ParsedResume.upload_timestamp.desc()).all()
-            return resumes
+            with self._session() as session:
+                query = session.query(ParsedResume)
+                
+                if search_field == 'skill':
+                    # Exact (case-insensitive) skill name, looked up through the resume_skills index
+                    matching_ids = select(ResumeSkill.resume_id).where(ResumeSkill.skill_name == search_term.lower())
+                    query = query.filter(ParsedResume.id.in_(matching_ids))
+                elif search_field in SEARCHABLE_FIELDS:
+                    column = getattr(ParsedResume, search_field)
+                    query = query.filter(column.ilike(f'%{search_term}%'))
+                
+                resumes = query.order_by(ParsedResume.upload_timestamp.desc()).all()
+                return resumes
             
         except Exception as e:
             self.logger.error(f"Error searching resumes: {str(e)}")
             return []
-        finally:
-            session.close()
     
     def get_statistics(self):
         """
@@ -303,43 +712,46 @@ class DatabaseManager:
         if not self.Session:
             return {}
         
-        session = self.Session()
         try:
-            total_resumes = session.query(ParsedResume).count()
-            successful_parses = session.query(ParsedResume).filter(ParsedResume.is_processed_successfully == True).count()
-            failed_parses = session.query(ParsedResume).filter(ParsedResume.is_processed_successfully == False).count()
-            
-            # Average scores
-            avg_score_result = session.query(
-                ParsedResume.overall_score
-            ).filter(ParsedResume.is_processed_successfully == True).all()
-            
-            if avg_score_result:
-                scores = [r.overall_score for r in avg_score_result if r.overall_score is not None]
-                avg_score = sum(scores) / len(scores) if scores else 0
-            else:
-                avg_score = 0
-            
-            # Recent activity
-            from sqlalchemy import func
-            recent_uploads = session.query(ParsedResume)\
-                                 .filter(ParsedResume.upload_timestamp >= func.now() - func.interval('7 days'))\
-                                 .count()
-            
-            return {
-                'total_resumes': total_resumes,
-                'successful_parses': successful_parses,
-                'failed_parses': failed_parses,
-                'success_rate': (successful_parses / total_resumes * 100) if total_resumes > 0 else 0,
-                'average_score': round(avg_score, 1),
-                'recent_uploads': recent_uploads
-            }
+            with self._session() as session:
+                # Every statistic comes from a single aggregate query
+                successful = ParsedResume.is_processed_successfully == True
+                failed = ParsedResume.is_processed_successfully == False
+                week_ago = datetime.utcnow() - timedelta(days=7)
+                
+                # Failed uploads live in their own table and are counted by subqueries
+                error_count = select(func.count(ParsedResumeError.id)).scalar_subquery()
+                recent_error_count = select(func.count(ParsedResumeError.id))\
+                    .where(ParsedResumeError.upload_timestamp >= week_ago).scalar_subquery()
+                
+                # FILTER (WHERE ...) aggregates; COUNT returns 0 rather than NULL on an empty table
+                (total_resumes, successful_parses, failed_parses, avg_score, recent_uploads,
+                 errors, recent_errors) = session.query(
+                    func.count(ParsedResume.id),
+                    func.count().filter(successful),
+                    func.count().filter(failed),
+                    func.avg(ParsedResume.overall_score).filter(successful),
+                    func.count().filter(ParsedResume.upload_timestamp >= week_ago),
+                    error_count,
+                    recent_error_count
+                ).one()
+                
+                total_resumes += errors
+                failed_parses += errors
+                recent_uploads += recent_errors
+                
+                return {
+                    'total_resumes': total_resumes,
+                    'successful_parses': successful_parses,
+                    'failed_parses': failed_parses,
+                    'success_rate': (successful_parses / total_resumes * 100) if total_resumes > 0 else 0,
+                    'average_score': round(float(avg_score or 0), 1),
+                    'recent_uploads': recent_uploads
+                }
             
         except Exception as e:
             self.logger.error(f"Error getting statistics: {str(e)}")
             return {}
-        finally:
-            session.close()
     
     def delete_resume(self, resume_id):
         """
@@ -354,27 +766,28 @@ class DatabaseManager:
         if not self.Session:
             return False
         
-        session = self.Session()
         try:
-            resume = session.query(ParsedResume).filter(ParsedResume.id == resume_id).first()
-            if resume:
-                session.delete(resume)
-                session.commit()
-                self.logger.info(f"Resume {resume_id} deleted successfully")
-                return True
-            else:
-                self.logger.warning(f"Resume {resume_id} not found")
-                return False
+            with self._session() as session:
+                resume = session.query(ParsedResume).filter(ParsedResume.id == resume_id).first()
+                if resume:
+                    # SQLite does not enforce the ON DELETE CASCADE, so remove the skills explicitly
+                    session.execute(delete(ResumeSkill.__table__).where(ResumeSkill.resume_id == resume_id))
+                    session.delete(resume)
+                    session.commit()
+                    self.logger.info(f"Resume {resume_id} deleted successfully")
+                    return True
+                else:
+                    self.logger.warning(f"Resume {resume_id} not found")
+                    return False
                 
         except Exception as e:
-            session.rollback()
             self.logger.error(f"Error deleting resume {resume_id}: {str(e)}")
             return False
-        finally:
-            session.close()
     
     def close_connection(self):
         """Close database connection"""
+        if self.Session:
+            self.Session.remove()
         if self.engine:
             self.engine.dispose()
             self.logger.info("Database connection closed")
\ No newline at end of file
@@ -4,6 +4,106 @@ from datetime import datetime
 import nltk
 from collections import Counter
 import logging
+from config import SPACY_MODEL, SPACY_DISABLED_PIPES, NLTK_DOWNLOADS
+
+try:
+    import ahocorasick  # optional (pyahocorasick), finds every skill keyword in one pass
+except ImportError:
+    ahocorasick = None
+
+# Patterns are compiled once here rather than looked up in re's cache per call
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_RES = (
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # US format
+    re.compile(r'\(\d{3}\)\s*\d{3}[-.]?\d{4}'),    # (123) 456-7890
+    re.compile(r'\+\d{1,3}[\s.-]?\d{3,4}[\s.-]?\d{3,4}[\s.-]?\d{3,4}'),  # International
+)
+LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+LOCATION_RES = (
+    re.compile(r'([A-Z][a-z]+),\s*([A-Z]{2})'),  # City, ST
+    re.compile(r'([A-Z][a-z]+),\s*([A-Z][a-z]+)'),  # City, State
+)
+JOB_BLOCK_SPLIT_RE = re.compile(r'\n(?=[A-Z][^a-z]*[A-Z])')
+TITLE_COMPANY_SPLIT_RE = re.compile(r'[|@-]|at\s+')
+DATE_RE = re.compile(r'\b(\d{4})\b|\b(\d{1,2}/\d{4})\b|\b(present|current)\b', re.IGNORECASE)
+YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+GPA_RE = re.compile(r'gpa:?[^\S\n]*(\d+\.?\d*)', re.IGNORECASE)  # never spans lines
+BULLET_RE = re.compile(r'[•\-\*]')
+SKILL_SPLIT_RE = re.compile(r'[,\n;]')
+# What may follow a skill keyword: a version number or a "js" suffix (html5, python3, reactjs)
+SKILL_SUFFIX_PATTERN = r'\d*(?:js)?(?!\w)'
+SKILL_SUFFIX_RE = re.compile(SKILL_SUFFIX_PATTERN)
+
+def _keyword_re(keywords):
+    """
+    Compile keywords into one case-insensitive, trie-shaped alternation
+    
+    pattern.search(line) is true exactly when
+    any(keyword in line.lower() for keyword in keywords) would be. Keywords
+    that contain another keyword can never change that answer, so they are
+    dropped; the rest share their common prefixes, e.g. 'pro(?:file|jects)',
+    so the regex engine rules out most positions after one or two characters.
+    """
+    keywords = {keyword.lower() for keyword in keywords}
+    keywords = [keyword for keyword in keywords if not any(other != keyword and other in keyword for other in keywords)]
+    if not keywords:
+        return re.compile(r'(?!)')  # matches nothing, like any() over no keywords
+    
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+    
+    return re.compile(_trie_pattern(trie), re.IGNORECASE)
+
+def _trie_pattern(node):
+    """Regex for a keyword trie; no keyword is a prefix of another, so leaves end every keyword"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items())]
+    if len(branches) <= 1:
+        return ''.join(branches)
+    return '(?:' + '|'.join(branches) + ')'
+
+# Common section headers
+SECTION_HEADER_RE = _keyword_re((
+    'experience', 'work experience', 'employment', 'career',
+    'education', 'academic background', 'qualifications',
+    'skills', 'technical skills', 'competencies',
+    'summary', 'profile', 'objective', 'about',
+    'projects', 'achievements', 'certifications'
+))
+SUMMARY_START_RE = _keyword_re(('summary', 'objective', 'profile', 'about', 'overview'))
+SUMMARY_STOP_RE = _keyword_re(('experience', 'education', 'skills', 'work'))
+DEGREE_RE = _keyword_re(('bachelor', 'master', 'phd', 'diploma'))
+INSTITUTION_RE = _keyword_re(('university', 'college', 'school', 'institute'))
+
+# Characters that rule a line out as a name; non-ASCII digits are checked separately
+NON_NAME_CHARS = frozenset('0123456789@')
+
+def _has_non_name_marks(line):
+    """True if a line has a digit, '@' or '.com', so can't be just a name"""
+    if not NON_NAME_CHARS.isdisjoint(line) or '.com' in line:
+        return True
+    return not line.isascii() and any(char.isdecimal() for char in line)
+
+def _is_word_char(char):
+    """True for characters that continue a word (same set as regex \\w)"""
+    return char.isalnum() or char == '_'
+
+# Per-process NLPProcessor shared by every ResumeParser
+_nlp_processor = None
+
+def get_nlp_processor():
+    """
+    Returns the process-wide NLPProcessor, creating it on first use
+    
+    Loading the spaCy model is the slow part of building a parser, so
+    every ResumeParser in a process shares one processor.
+    """
+    global _nlp_processor
+    if _nlp_processor is None:
+        _nlp_processor = NLPProcessor()
+    return _nlp_processor
 
 class NLPProcessor:
     """NLP processing for resume text analysis and information extraction"""
@@ -11,22 +111,28 @@ class NLPProcessor:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Load spaCy model
+        # Load spaCy model with only the components needed for entities
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load(SPACY_MODEL, disable=SPACY_DISABLED_PIPES)
         except OSError:
             self.logger.warning("spaCy English model not found. Downloading now...")
             from spacy.cli import download
-            download("en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+            download(SPACY_MODEL)
+            self.nlp = spacy.load(SPACY_MODEL, disable=SPACY_DISABLED_PIPES)
+        
+        if 'ner' not in self.nlp.pipe_names:
+            self.logger.warning(f"spaCy model {SPACY_MODEL} has no 'ner' component; names and locations will rely on patterns only")
 
         
-        # Download required NLTK data
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-        except:
-            pass
+        # Download required NLTK data, unless it is already installed
+        for package, resource in NLTK_DOWNLOADS.items():
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                try:
+                    nltk.download(package, quiet=True)
+                except Exception:
+                    pass
         
         # Common skills keywords
         self.skill_keywords = {
@@ -38,11 +144,23 @@ class NLPProcessor:
             'tools': ['git', 'jira', 'confluence', 'slack', 'trello', 'figma', 'photoshop', 'illustrator']
         }
         
+        # Keyword -> display category, in skill_keywords order
+        self._skill_categories = {}
+        for category, skill_list in self.skill_keywords.items():
+            display_category = category.replace('_', ' ').title()
+            for skill in skill_list:
+                self._skill_categories.setdefault(skill, display_category)
+        self._skill_matcher = self._build_skill_matcher()
+        
         # Education keywords
         self.education_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'college', 'school', 'diploma', 'certificate']
         
         # Experience keywords
         self.experience_keywords = ['experience', 'work', 'employment', 'career', 'position', 'role', 'job']
+        
+        # Section title matchers for the keyword lists above
+        self._experience_title_re = _keyword_re(self.experience_keywords)
+        self._education_title_re = _keyword_re(self.education_keywords)
     
     def process_resume_text(self, text):
         """
@@ -55,53 +173,70 @@ class NLPProcessor:
             dict: Structured resume data
         """
         # Process text with spaCy
-        doc = self.nlp(text)
+        return self._assemble(text, self.nlp(text))
+    
+    def process_resume_texts(self, texts, batch_size=32):
+        """
+        Process several resume texts, running spaCy over them in batches
+        
+        Args:
+            texts (list): Raw resume texts
+            batch_size (int): Number of texts spaCy processes together
+            
+        Returns:
+            list: Structured resume data for each text, in input order
+        """
+        docs = self.nlp.pipe(texts, batch_size=batch_size)
+        return [self._assemble(text, doc) for text, doc in zip(texts, docs)]
+    
+    def _assemble(self, text, doc):
+        """Build the structured resume data from the text and its spaCy doc"""
+        # Split into stripped lines, sections and lowercase once; the
+        # extractors share them
+        lines = [line.strip() for line in text.split('\n')]
+        sections = self._split_into_sections(text, lines)
+        text_lower = text.lower()
         
         # Extract different sections
         parsed_data = {
-            'personal_info': self._extract_personal_info(text, doc),
-            'summary': self._extract_summary(text),
-            'experience': self._extract_experience(text),
-            'education': self._extract_education(text),
-            'skills': self._extract_skills(text),
+            'personal_info': self._extract_personal_info(text, doc, text_lower, lines),
+            'summary': self._extract_summary(text, lines),
+            'experience': self._extract_experience(text, sections),
+            'education': self._extract_education(text, sections),
+            'skills': self._extract_skills(text, sections, text_lower),
             'raw_text': text
         }
         
         return parsed_data
     
-    def _extract_personal_info(self, text, doc):
+    def _extract_personal_info(self, text, doc, text_lower=None, lines=None):
         """Extract personal information (name, email, phone, location)"""
         personal_info = {}
         
+        # Only the first match of each pattern is kept, so search() is used
+        # to stop scanning there instead of collecting every match
+        
         # Extract email
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            personal_info['email'] = emails[0]
-        
-        # Extract phone number
-        phone_patterns = [
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # US format
-            r'\(\d{3}\)\s*\d{3}[-.]?\d{4}',    # (123) 456-7890
-            r'\+\d{1,3}[\s.-]?\d{3,4}[\s.-]?\d{3,4}[\s.-]?\d{3,4}',  # International
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                personal_info['phone'] = phones[0]
+        email_match = EMAIL_RE.search(text)
+        if email_match:
+            personal_info['email'] = email_match.group()
+        
+        # Extract phone number (patterns are tried in priority order)
+        for pattern in PHONE_RES:
+            phone_match = pattern.search(text)
+            if phone_match:
+                personal_info['phone'] = phone_match.group()
                 break
         
         # Extract name (first person entity or from first lines)
-        name = self._extract_name(text, doc)
+        name = self._extract_name(text, doc, lines)
         if name:
             personal_info['name'] = name
         
         # Extract LinkedIn profile
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin_matches = re.findall(linkedin_pattern, text.lower())
-        if linkedin_matches:
-            personal_info['linkedin'] = linkedin_matches[0]
+        linkedin_match = LINKEDIN_RE.search(text_lower if text_lower is not None else text.lower())
+        if linkedin_match:
+            personal_info['linkedin'] = linkedin_match.group()
         
         # Extract location (look for city, state patterns)
         location = self._extract_location(text, doc)
@@ -110,7 +245,7 @@ class NLPProcessor:
         
         return personal_info
     
-    def _extract_name(self, text, doc):
+    def _extract_name(self, text, doc, lines=None):
         """Extract person's name from resume"""
         # Look for PERSON entities
         for ent in doc.ents:
@@ -118,184 +253,208 @@ class NLPProcessor:
                 return ent.text.strip()
         
         # Fallback: look in first few lines for name-like patterns
-        lines = text.split('\n')[:5]
-        for line in lines:
-            line = line.strip()
-            if line and len(line.split()) >= 2 and len(line.split()) <= 4:
+        if lines is None:
+            lines = [line.strip() for line in text.split('\n', 5)[:5]]
+        for line in lines[:5]:
+            if line and 2 <= len(line.split()) <= 4:
                 # Check if it looks like a name (no numbers, reasonable length)
-                if not re.search(r'\d|@|\.com', line) and len(line) < 50:
+                if len(line) < 50 and not _has_non_name_marks(line):
                     return line
         
         return None
     
     def _extract_location(self, text, doc):
         """Extract location information"""
-        # Look for GPE (Geopolitical entity) in spaCy
-        locations = []
-        for ent in doc.ents:
-            if ent.label_ in ["GPE", "LOC"]:
-                locations.append(ent.text)
-        
         # Common location patterns
-        location_patterns = [
-            r'([A-Z][a-z]+),\s*([A-Z]{2})',  # City, ST
-            r'([A-Z][a-z]+),\s*([A-Z][a-z]+)',  # City, State
-        ]
+        for pattern in LOCATION_RES:
+            location_match = pattern.search(text)
+            if location_match:
+                return f"{location_match.group(1)}, {location_match.group(2)}"
         
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return f"{matches[0][0]}, {matches[0][1]}"
+        # Otherwise the first GPE (Geopolitical entity) or LOC from spaCy
+        for ent in doc.ents:
+            if ent.label_ in ("GPE", "LOC"):
+                return ent.text
         
-        return locations[0] if locations else None
+        return None
     
-    def _extract_summary(self, text):
+    def _extract_summary(self, text, lines=None):
         """Extract professional summary or objective"""
-        summary_keywords = ['summary', 'objective', 'profile', 'about', 'overview']
-        
-        lines = text.split('\n')
+        if lines is None:
+            lines = [line.strip() for line in text.split('\n')]
         summary_started = False
         summary_lines = []
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-            
+        for line in lines:
             # Check if this line starts a summary section
-            if any(keyword in line_lower for keyword in summary_keywords):
+            if SUMMARY_START_RE.search(line):
                 summary_started = True
                 continue
             
             # If we're in summary section, collect lines
             if summary_started:
-                if line.strip():
+                if line:
                     # Stop if we hit another section
-                    if any(keyword in line_lower for keyword in ['experience', 'education', 'skills', 'work']):
+                    if SUMMARY_STOP_RE.search(line):
                         break
-                    summary_lines.append(line.strip())
+                    summary_lines.append(line)
                 elif summary_lines:  # Empty line after collecting some summary
                     break
         
         if summary_lines:
             return ' '.join(summary_lines)
         
-        # Fallback: take first substantial paragraph
-        paragraphs = text.split('\n\n')
+        # Fallback: take first substantial paragraph (only the first three
+        # paragraphs are ever looked at, so stop splitting after them)
+        paragraphs = text.split('\n\n', 3)
         for para in paragraphs[1:3]:  # Skip first paragraph (usually name/contact)
             if len(para.strip()) > 100:
                 return para.strip()
         
         return None
     
-    def _extract_experience(self, text):
+    def _extract_experience(self, text, sections=None):
         """Extract work experience information"""
         experience_list = []
         
         # Split text into sections
-        sections = self._split_into_sections(text)
+        if sections is None:
+            sections = self._split_into_sections(text)
         
         for section in sections:
-            if any(keyword in section['title'].lower() for keyword in self.experience_keywords):
+            if self._experience_title_re.search(section['title']):
                 jobs = self._parse_experience_section(section['content'])
                 experience_list.extend(jobs)
         
         return experience_list
     
-    def _extract_education(self, text):
+    def _extract_education(self, text, sections=None):
         """Extract education information"""
         education_list = []
         
         # Split text into sections
-        sections = self._split_into_sections(text)
+        if sections is None:
+            sections = self._split_into_sections(text)
         
         for section in sections:
-            if any(keyword in section['title'].lower() for keyword in self.education_keywords):
+            if self._education_title_re.search(section['title']):
                 education = self._parse_education_section(section['content'])
                 education_list.extend(education)
         
         return education_list
     
-    def _extract_skills(self, text):
+    def _extract_skills(self, text, sections=None, text_lower=None):
         """Extract skills and competencies"""
-        skills = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Extract from all skill categories
-        for category, skill_list in self.skill_keywords.items():
-            found_skills = []
-            for skill in skill_list:
-                if skill in text_lower:
-                    found_skills.append({
-                        'name': skill,
-                        'category': category.replace('_', ' ').title()
-                    })
-            skills.extend(found_skills)
+        # Extract from all skill categories, keeping keyword order
+        found_keywords = self._find_skill_keywords(text_lower)
+        categories = self._skill_categories
+        skills = [
+            {'name': skill, 'category': categories[skill]}
+            for skill in filter(found_keywords.__contains__, categories)
+        ] if found_keywords else []
         
         # Look for skills section
-        sections = self._split_into_sections(text)
+        if sections is None:
+            sections = self._split_into_sections(text)
         for section in sections:
             if 'skill' in section['title'].lower():
                 additional_skills = self._parse_skills_section(section['content'])
                 skills.extend(additional_skills)
         
-        # Remove duplicates
-        unique_skills = []
-        seen_skills = set()
+        # Remove duplicates, keeping the first occurrence of each name
+        unique_skills = {}
         for skill in skills:
-            skill_name = skill['name'] if isinstance(skill, dict) else skill
-            if skill_name not in seen_skills:
-                unique_skills.append(skill)
-                seen_skills.add(skill_name)
+            unique_skills.setdefault(skill['name'] if isinstance(skill, dict) else skill, skill)
         
-        return unique_skills
+        return list(unique_skills.values())
     
-    def _split_into_sections(self, text):
+    def _build_skill_matcher(self):
+        """
+        Build the matcher used by _find_skill_keywords for all skill keywords
+        
+        An Aho-Corasick automaton when pyahocorasick is installed, otherwise
+        one compiled alternation (longest keywords first).
+        """
+        keywords = self._skill_categories
+        
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            return automaton
+        
+        alternation = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+        return re.compile(rf'(?<!\w)(?:{alternation})(?={SKILL_SUFFIX_PATTERN})')
+    
+    def _find_skill_keywords(self, text_lower):
+        """
+        Find the skill keywords that start a word in lowercased text
+        
+        A keyword may be followed by a version number or "js" (html5, python3,
+        reactjs) but not by other letters, so "go" is not found in "google".
+        
+        Args:
+            text_lower (str): Lowercased resume text
+            
+        Returns:
+            set: Matched keywords
+        """
+        if ahocorasick is None:
+            return set(self._skill_matcher.findall(text_lower))
+        
+        found = set()
+        for end, keyword in self._skill_matcher.iter(text_lower):
+            start = end - len(keyword) + 1
+            # Skip hits inside a longer word, e.g. "go" in "google"
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if not SKILL_SUFFIX_RE.match(text_lower, end + 1):
+                continue
+            found.add(keyword)
+        return found
+    
+    def _split_into_sections(self, text, lines=None):
         """Split resume text into logical sections"""
         sections = []
-        lines = text.split('\n')
-        current_section = {'title': '', 'content': ''}
+        if lines is None:
+            lines = [line.strip() for line in text.split('\n')]
+        # Content lines are collected in a list and joined once per section
+        current_title = ''
+        current_lines = []
         
         for line in lines:
-            line = line.strip()
             if not line:
                 continue
             
             # Check if this line is a section header
             if self._is_section_header(line):
-                if current_section['content']:
-                    sections.append(current_section)
-                current_section = {'title': line, 'content': ''}
+                if current_lines:
+                    sections.append({'title': current_title, 'content': '\n'.join(current_lines) + '\n'})
+                current_title = line
+                current_lines = []
             else:
-                current_section['content'] += line + '\n'
+                current_lines.append(line)
         
         # Add last section
-        if current_section['content']:
-            sections.append(current_section)
+        if current_lines:
+            sections.append({'title': current_title, 'content': '\n'.join(current_lines) + '\n'})
         
         return sections
     
     def _is_section_header(self, line):
         """Determine if a line is a section header"""
-        if len(line) > 50:
-            return False
-        
-        # Common section headers
-        section_headers = [
-            'experience', 'work experience', 'employment', 'career',
-            'education', 'academic background', 'qualifications',
-            'skills', 'technical skills', 'competencies',
-            'summary', 'profile', 'objective', 'about',
-            'projects', 'achievements', 'certifications'
-        ]
-        
-        line_lower = line.lower()
-        return any(header in line_lower for header in section_headers)
+        return len(line) <= 50 and SECTION_HEADER_RE.search(line) is not None
     
     def _parse_experience_section(self, content):
         """Parse experience section content"""
         jobs = []
         
         # Split by common job separators
-        job_blocks = re.split(r'\n(?=[A-Z][^a-z]*[A-Z])', content)
+        job_blocks = JOB_BLOCK_SPLIT_RE.split(content)
         
         for block in job_blocks:
             if len(block.strip()) < 20:
@@ -309,7 +468,7 @@ class NLPProcessor:
     
     def _parse_job_block(self, block):
         """Parse individual job block"""
-        lines = [line.strip() for line in block.split('\n') if line.strip()]
+        lines = [line for line in map(str.strip, block.split('\n')) if line]
         if not lines:
             return None
         
@@ -318,22 +477,19 @@ class NLPProcessor:
         # First line usually contains title and company
         first_line = lines[0]
         if '|' in first_line or '-' in first_line or 'at' in first_line.lower():
-            parts = re.split(r'[|@-]|at\s+', first_line, 1)
+            parts = TITLE_COMPANY_SPLIT_RE.split(first_line, 1)
             if len(parts) >= 2:
                 job['title'] = parts[0].strip()
                 job['company'] = parts[1].strip()
         
-        # Look for dates
-        date_pattern = r'\b(\d{4})\b|\b(\d{1,2}/\d{4})\b|\b(present|current)\b'
-        for line in lines[1:3]:
-            if re.search(date_pattern, line, re.IGNORECASE):
-                job['duration'] = line
-                break
-        
-        # Combine remaining lines as description
+        # Look for dates in the next two lines; the remaining lines without
+        # a date make up the description (one date check per line)
         desc_lines = []
-        for line in lines[1:]:
-            if not re.search(date_pattern, line, re.IGNORECASE):
+        for index, line in enumerate(lines[1:], start=1):
+            if DATE_RE.search(line):
+                if index <= 2 and 'duration' not in job:
+                    job['duration'] = line
+            else:
                 desc_lines.append(line)
         
         if desc_lines:
@@ -360,7 +516,7 @@ class NLPProcessor:
     
     def _parse_education_block(self, block):
         """Parse individual education block"""
-        lines = [line.strip() for line in block.split('\n') if line.strip()]
+        lines = [line for line in map(str.strip, block.split('\n')) if line]
         if not lines:
             return None
         
@@ -368,26 +524,26 @@ class NLPProcessor:
         
         # Look for degree and institution
         for line in lines:
-            if any(degree in line.lower() for degree in ['bachelor', 'master', 'phd', 'diploma']):
+            if DEGREE_RE.search(line):
                 education['degree'] = line
-            elif any(inst in line.lower() for inst in ['university', 'college', 'school', 'institute']):
+            elif INSTITUTION_RE.search(line):
                 education['institution'] = line
         
-        # Look for year
-        year_pattern = r'\b(19|20)\d{2}\b'
-        for line in lines:
-            years = re.findall(year_pattern, line)
-            if years:
-                education['year'] = years[-1]  # Take the latest year
-                break
+        # Year and GPA are searched in the whole block at once; neither
+        # pattern spans lines, so the first match is on the first line that has one
+        text = '\n'.join(lines)
+        
+        # Look for year, taking the latest one on the first line with a year
+        year_match = YEAR_RE.search(text)
+        if year_match:
+            line_end = text.find('\n', year_match.end())
+            years = YEAR_RE.findall(text, year_match.start(), line_end if line_end != -1 else len(text))
+            education['year'] = years[-1]
         
         # Look for GPA
-        gpa_pattern = r'gpa:?\s*(\d+\.?\d*)'
-        for line in lines:
-            gpa_match = re.search(gpa_pattern, line.lower())
-            if gpa_match:
-                education['gpa'] = gpa_match.group(1)
-                break
+        gpa_match = GPA_RE.search(text)
+        if gpa_match:
+            education['gpa'] = gpa_match.group(1)
         
         return education if education else None
     
@@ -396,8 +552,8 @@ class NLPProcessor:
         skills = []
         
         # Split by common separators
-        skill_text = re.sub(r'[•\-\*]', ',', content)
-        potential_skills = re.split(r'[,\n;]', skill_text)
+        skill_text = BULLET_RE.sub(',', content)
+        potential_skills = SKILL_SPLIT_RE.split(skill_text)
         
         for skill in potential_skills:
             skill = skill.strip()
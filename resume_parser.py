@@ -1,36 +1,120 @@
 import os
-from text_extractors import PDFExtractor, DOCXExtractor
-from nlp_processor import NLPProcessor
+import io
+import re
+import time
+from text_extractors import extract
+from nlp_processor import get_nlp_processor
 import logging
+from concurrent.futures import ProcessPoolExecutor
+
+# "2015 - 2019" / "2020 – present" style ranges in experience durations
+YEAR_RANGE_RE = re.compile(r'(\d{4})\s*[-–]\s*(\d{4}|present|current)')
+ONGOING_END_WORDS = frozenset(('present', 'current'))
+ONGOING_END_YEAR = 2024  # end year counted for ranges that are still ongoing
+
+# Per-process parser shared by the app and parse_resume_in_worker
+_shared_parser = None
+
+def get_shared_parser():
+    """
+    Returns the process-wide ResumeParser, creating it on first use
+    
+    Pool workers build their own once, in the pool initializer, and reuse
+    it for every resume they parse.
+    """
+    global _shared_parser
+    if _shared_parser is None:
+        _shared_parser = ResumeParser()
+    return _shared_parser
+
+def parse_resume_in_worker(file_path, filename=None):
+    """
+    Parse a resume inside a worker process
+    
+    The worker uses its own (or its inherited) shared ResumeParser, so the
+    spaCy model is never pickled from the caller.
+    
+    Args:
+        file_path (str or bytes): Path to the resume file, or its raw contents
+        filename (str): Original filename, required when passing raw contents
+        
+    Returns:
+        tuple: (parsed data or None, processing time in seconds)
+    """
+    parser = get_shared_parser()
+    
+    start_time = time.time()
+    parsed_data = parser.parse_resume(file_path, filename)
+    return parsed_data, time.time() - start_time
 
 class ResumeParser:
     """Main resume parsing class that coordinates text extraction and NLP processing"""
     
     def __init__(self):
-        self.pdf_extractor = PDFExtractor()
-        self.docx_extractor = DOCXExtractor()
-        self.nlp_processor = NLPProcessor()
+        self.nlp_processor = get_nlp_processor()
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
-    def parse_resume(self, file_path):
+    def parse_resumes(self, file_paths, workers=None):
+        """
+        Parse several resume files in parallel worker processes
+        
+        Each worker uses its own shared parser (see worker_init), so this
+        instance's spaCy model is never sent to the workers.
+        
+        Args:
+            file_paths (list): Paths to the resume files
+            workers (int): Number of worker processes, defaults to the CPU count
+            
+        Returns:
+            list: Parsed data (or None on failure) for each file, in input order
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) < 2:
+            # A single file can still spread a long PDF's pages over processes
+            return [self.parse_resume(file_path, parallel_pages=True) for file_path in file_paths]
+        
+        # worker_init imports this module, so it can't be imported at the top
+        import worker_init
+        
+        max_workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=worker_init.get_mp_context(),
+            initializer=worker_init.init
+        ) as executor:
+            results = executor.map(parse_resume_in_worker, file_paths, chunksize=4)
+            return [parsed_data for parsed_data, _ in results]
+    
+    def parse_resume(self, file_path, filename=None, parallel_pages=False):
         """
         Parse a resume file and extract structured information
         
+        Small uploads can be parsed straight from memory by passing the raw
+        bytes (or a binary file object) together with the original filename.
+        
         Args:
-            file_path (str): Path to the resume file
+            file_path (str, bytes or file-like): Path to the resume file, or its contents
+            filename (str): Original filename, required when file_path is not a path
+            parallel_pages (bool): Let long PDFs be split across worker processes;
+                keep it off inside threaded servers such as Streamlit
             
         Returns:
             dict: Parsed resume data with structured information
         """
+        if isinstance(file_path, (bytes, bytearray)):
+            file_path = io.BytesIO(file_path)
+        
+        source_name = filename or os.path.basename(file_path)
+        
         try:
             # Extract text based on file type
-            text = self._extract_text(file_path)
+            text = self._extract_text(file_path, source_name, parallel_pages)
             
             if not text or len(text.strip()) < 50:
-                self.logger.warning(f"Insufficient text extracted from {file_path}")
+                self.logger.warning(f"Insufficient text extracted from {source_name}")
                 return None
             
             # Process text with NLP
@@ -38,8 +122,8 @@ class ResumeParser:
             
             # Add metadata
             parsed_data['file_info'] = {
-                'filename': os.path.basename(file_path),
-                'file_size': os.path.getsize(file_path),
+                'filename': source_name,
+                'file_size': self._get_file_size(file_path),
                 'text_length': len(text)
             }
             
@@ -52,19 +136,24 @@ class ResumeParser:
             return parsed_data
             
         except Exception as e:
-            self.logger.error(f"Error parsing resume {file_path}: {str(e)}")
+            self.logger.error(f"Error parsing resume {source_name}: {str(e)}")
             return None
     
-    def _extract_text(self, file_path):
-        """Extract text from file based on extension"""
-        file_extension = os.path.splitext(file_path)[1].lower()
-        
-        if file_extension == '.pdf':
-            return self.pdf_extractor.extract_text(file_path)
-        elif file_extension == '.docx':
-            return self.docx_extractor.extract_text(file_path)
-        else:
-            raise ValueError(f"Unsupported file format: {file_extension}")
+    def _extract_text(self, file_path, filename, parallel_pages=False):
+        """Extract text from file based on its content"""
+        try:
+            return extract(file_path, parallel_pages)
+        except ValueError:
+            raise ValueError(f"Unsupported file format: {filename} is not a PDF or DOCX file")
+    
+    def _get_file_size(self, file_path):
+        """Get the size in bytes of a file path or in-memory file object"""
+        if isinstance(file_path, (str, os.PathLike)):
+            return os.path.getsize(file_path)
+        
+        size = file_path.seek(0, io.SEEK_END)
+        file_path.seek(0)
+        return size
     
     def _calculate_overall_score(self, parsed_data):
         """Calculate an overall candidate score based on extracted information"""
@@ -73,7 +162,12 @@ class ResumeParser:
         # Experience score (0-40 points)
         experience = parsed_data.get('experience', [])
         if experience:
-            years_experience = sum([self._extract_years_from_duration(exp.get('duration', '')) for exp in experience])
+            # Stop once 10 years are counted; more can't raise the score
+            years_experience = 0
+            for exp in experience:
+                years_experience += self._extract_years_from_duration(exp.get('duration', ''))
+                if years_experience >= 10:
+                    break
             experience_score = min(years_experience * 4, 40)  # Max 40 points for 10+ years
             score += experience_score
         
@@ -102,22 +196,14 @@ class ResumeParser:
     
     def _extract_years_from_duration(self, duration_text):
         """Extract years of experience from duration text"""
-        import re
-        
         if not duration_text:
             return 0
         
-        # Try to find year patterns
-        year_pattern = r'(\d{4})\s*[-–]\s*(\d{4}|present|current)'
-        matches = re.findall(year_pattern, duration_text.lower())
-        
-        total_years = 0
-        for match in matches:
-            start_year = int(match[0])
-            end_year = 2024 if match[1] in ['present', 'current'] else int(match[1])
-            total_years += max(0, end_year - start_year)
-        
-        return total_years
+        # Sum every year range, ignoring ones that end before they start
+        return sum(
+            max(0, (ONGOING_END_YEAR if end in ONGOING_END_WORDS else int(end)) - int(start))
+            for start, end in YEAR_RANGE_RE.findall(duration_text.lower())
+        )
     
     def _calculate_confidence_scores(self, parsed_data, original_text):
         """Calculate confidence scores for each extracted section"""
@@ -10,31 +10,23 @@ import subprocess
 import sys
 import os
 from pathlib import Path
+from runner_setup import is_installed, download_nltk_data
 
 def check_dependencies():
     """Check if all required dependencies are installed"""
+    # Distribution (pip) names, so nothing has to be imported to check them
     required_packages = [
         'streamlit',
         'spacy',
         'nltk',
         'PyPDF2',
         'pdfplumber',
-        'docx',
+        'python-docx',
         'pandas',
         'openpyxl'
     ]
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            if package == 'docx':
-                missing_packages.append('python-docx')
-            else:
-                missing_packages.append(package)
-    
-    return missing_packages
+    return [package for package in required_packages if not is_installed(package)]
 
 def install_dependencies():
     """Install missing dependencies"""
@@ -73,6 +65,7 @@ def download_spacy_model():
         print("You may need to run: python -m spacy download en_core_web_sm")
         return False
 
+
 def run_app(port=8501, host='localhost'):
     """Run the Streamlit application"""
     app_file = Path(__file__).parent / 'app.py'
@@ -123,11 +116,15 @@ def main():
             print("pip install " + " ".join(missing))
             sys.exit(1)
     
-    # Check spaCy model
-    try:
-        import spacy
-        spacy.load('en_core_web_sm')
-    except OSError:
+    # Fetch any missing NLTK data
+    print("Checking NLTK data...")
+    if download_nltk_data():
+        print("NLTK data ready!")
+    else:
+        print("Error downloading NLTK data")
+    
+    # Check spaCy model (installed as a package, so no need to load it here)
+    if not is_installed('en_core_web_sm'):
         print("spaCy English model not found.")
         model_choice = input("Download spaCy model? (y/n): ").lower().strip()
         
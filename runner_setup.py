@@ -0,0 +1,47 @@
+"""
+Setup helpers shared by run.py and simple_run.py.
+
+Nothing here imports the app's dependencies, since the runners use these
+helpers before those dependencies are installed.
+"""
+
+import subprocess
+import sys
+from importlib.metadata import distribution, PackageNotFoundError
+from config import NLTK_DOWNLOADS
+
+def is_installed(distribution_name):
+    """Check whether a distribution is installed by reading its metadata, without importing it"""
+    try:
+        distribution(distribution_name)
+        return True
+    except PackageNotFoundError:
+        return False
+
+def download_nltk_data(quiet=False):
+    """
+    Download any NLTK data in config.NLTK_DOWNLOADS that isn't installed yet,
+    so the app doesn't fetch it on first start
+    
+    Args:
+        quiet (bool): Hide the downloader's output
+    
+    Returns:
+        bool: True once every resource is installed
+    """
+    # Runs in a fresh interpreter, since nltk may have only just been installed
+    script = (
+        "import sys, nltk\n"
+        f"for package, resource in {NLTK_DOWNLOADS!r}.items():\n"
+        "    try:\n"
+        "        nltk.data.find(resource)\n"
+        "    except LookupError:\n"
+        "        if not nltk.download(package, quiet=True):\n"
+        "            sys.exit(1)\n"
+    )
+    output = subprocess.DEVNULL if quiet else None
+    try:
+        subprocess.check_call([sys.executable, '-c', script], stdout=output, stderr=output)
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
\ No newline at end of file
@@ -7,7 +7,7 @@ setup(
     author="Resume Parser Project",
     packages=find_packages(),
     install_requires=[
-        "streamlit>=1.28.0",
+        "streamlit>=1.37.0",
         "spacy>=3.7.0",
         "nltk>=3.8.1",
         "PyPDF2>=3.0.1",
@@ -15,8 +15,10 @@ setup(
         "python-docx>=1.1.0",
         "pandas>=2.1.0",
         "openpyxl>=3.1.0",
+        "xlsxwriter>=3.1.0",
+        "pyarrow>=14.0.0",
         "psycopg2-binary>=2.9.0",
-        "sqlalchemy>=2.0.0",
+        "sqlalchemy>=2.0.10",
     ],
     python_requires=">=3.8",
     classifiers=[
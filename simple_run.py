@@ -9,6 +9,7 @@ It handles all dependencies and setup automatically.
 import subprocess
 import sys
 import os
+from runner_setup import is_installed, download_nltk_data
 
 def install_packages():
     """Install required packages"""
@@ -25,9 +26,22 @@ def install_packages():
     ]
     
     print("Installing packages...")
+    pip_install = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check', '--no-input']
+    
+    # One pip run resolves everything together; if it fails, retry one by
+    # one so a single bad package doesn't block the rest
+    try:
+        subprocess.check_call(pip_install + packages,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for package in packages:
+            print(f"✓ {package}")
+        return
+    except:
+        pass
+    
     for package in packages:
         try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', package], 
+            subprocess.check_call(pip_install + [package], 
                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print(f"✓ {package}")
         except:
@@ -42,23 +56,27 @@ def download_model():
     except:
         print("✗ spaCy model download failed (will try to continue)")
 
+
 def main():
     print("Resume Parser Setup")
     print("=" * 30)
     
     # Quick dependency check
-    try:
-        import streamlit
+    if is_installed('streamlit'):
         print("✓ Dependencies already installed")
-    except ImportError:
+    else:
         install_packages()
     
+    # Fetch any missing NLTK data
+    if download_nltk_data(quiet=True):
+        print("✓ NLTK data ready")
+    else:
+        print("✗ NLTK data download failed (will try to continue)")
+    
     # Model check
-    try:
-        import spacy
-        spacy.load('en_core_web_sm')
+    if is_installed('en_core_web_sm'):
         print("✓ spaCy model ready")
-    except:
+    else:
         download_model()
     
     # Run the app
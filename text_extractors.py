@@ -1,28 +1,246 @@
 import PyPDF2
 import pdfplumber
 from docx import Document
+from lxml import etree
 import logging
+import re
 import io
+import os
+import multiprocessing
+import posixpath
+import zipfile
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pymupdf  # optional (PyMuPDF), C-based and much faster for plain text
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF releases before 1.24
+    except ImportError:
+        pymupdf = None
+
+try:
+    import pypdfium2 as pdfium  # optional, C-based PDFium bindings
+except ImportError:
+    pdfium = None
+
+logger = logging.getLogger(__name__)
+
+# Extracted text shorter than this means a method failed and the next one is tried
+MIN_PDF_TEXT_LENGTH = 100
+
+# The %PDF- header must appear within the first 1024 bytes; the trailer
+# (and with it any /Encrypt entry) is looked for in the last few KB
+PDF_HEADER_SEARCH_BYTES = 1024
+PDF_TRAILER_SEARCH_BYTES = 4096
+PDF_ENCRYPT_RE = re.compile(rb'/Encrypt\b')
+
+# PDFs with at least this many pages have their pdfplumber pages split across
+# worker processes when the caller asks for it (parallel_pages); below it the
+# pool start-up costs more than it saves
+PARALLEL_PDF_MIN_PAGES = 8
+
+# With a max_chars budget the pool gets page ranges of this size in page
+# order, so it can stop handing out work once the budget is met
+PARALLEL_PDF_PAGES_PER_TASK = 4
+
+# PDF page loops stop once this many characters have been extracted; whole
+# pages are kept, so the result can run slightly over
+MAX_PDF_TEXT_CHARS = 200_000
+
+# Texts of files on disk kept by TextExtractor.extract_text
+EXTRACTION_CACHE_MAX_ENTRIES = 128
+
+# Parsed DOCX documents kept so text and formatting extraction share one parse
+DOCX_DOCUMENT_CACHE_MAX_ENTRIES = 32
+
+@lru_cache(maxsize=EXTRACTION_CACHE_MAX_ENTRIES)
+def _extract_file_text(extractor_class, path, mtime_ns, size, **options):
+    """
+    Cached extraction for a file on disk
+    
+    The modification time, size and extraction options are part of the key,
+    so a file that is rewritten in place is extracted again.
+    """
+    return extractor_class()._extract_text(path, **options)
+
+WORD_NAMESPACES = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+
+# Runs of the body paragraphs with direct bold / italic formatting that is not
+# switched off, matching what Run.bold and Run.italic report
+_TOGGLE_ON = "[not(@w:val) or not(@w:val='0' or @w:val='false' or @w:val='off')]"
+_BOLD_RUNS_XP = etree.XPath(f"w:p/w:r[w:rPr/w:b{_TOGGLE_ON}]", namespaces=WORD_NAMESPACES)
+_ITALIC_RUNS_XP = etree.XPath(f"w:p/w:r[w:rPr/w:i{_TOGGLE_ON}]", namespaces=WORD_NAMESPACES)
+
+# Paragraph styles reported as headings by extract_formatting_info
+HEADING_STYLES = frozenset({f'Heading {level}' for level in range(1, 10)} | {'Title', 'Subtitle'})
+
+# DOCX files have no fixed pages; DOCXExtractor.iter_pages groups this many
+# paragraphs or table rows into each page it yields
+DOCX_PARAGRAPHS_PER_PAGE = 50
+
+# Clark-notation prefixes for the tags and attributes read while streaming a DOCX
+_W = '{%s}' % WORD_NAMESPACES['w']
+_R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+# Text python-docx gives the non-text run children
+_RUN_CHILD_TEXT = {_W + 'tab': "\t", _W + 'ptab': "\t", _W + 'cr': "\n", _W + 'noBreakHyphen': "-"}
+
+def _docx_xml_parser():
+    """XML parser with python-docx's settings; entities are never resolved"""
+    return etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+def _docx_run_text(run):
+    """Text of a w:r element, as python-docx's Run.text"""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W + 't':
+            parts.append(child.text or "")
+        elif tag == _W + 'br':
+            # Page and column breaks have no text
+            if child.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                parts.append("\n")
+        elif tag in _RUN_CHILD_TEXT:
+            parts.append(_RUN_CHILD_TEXT[tag])
+    return "".join(parts)
+
+def _docx_paragraph_text(paragraph):
+    """Text of a w:p element including its hyperlinks, as python-docx's Paragraph.text"""
+    parts = []
+    for child in paragraph:
+        if child.tag == _W + 'r':
+            parts.append(_docx_run_text(child))
+        elif child.tag == _W + 'hyperlink':
+            parts.extend(_docx_run_text(run) for run in child.iterchildren(_W + 'r'))
+    return "".join(parts)
+
+def _docx_int_property(properties, name, default):
+    """Integer w:val of a child of a w:tcPr / w:trPr element"""
+    if properties is not None:
+        element = properties.find(_W + name)
+        if element is not None:
+            return int(element.get(_W + 'val'))
+    return default
+
+def _docx_table_rows(table):
+    """
+    Row texts of a w:tbl element, joined with " | " from its non-blank cells
+    
+    Like python-docx's row.cells, a cell spanning several grid columns is
+    repeated once per column and a vertically merged cell repeats the text of
+    the cell it continues.
+    """
+    rows = []
+    above = {}  # grid offset -> (text, span) of the cells in the previous row
+    
+    for row in table.iterchildren(_W + 'tr'):
+        offset = _docx_int_property(row.find(_W + 'trPr'), 'gridBefore', 0)
+        cells = {}
+        row_text = []
+        
+        for cell in row.iterchildren(_W + 'tc'):
+            properties = cell.find(_W + 'tcPr')
+            grid_span = _docx_int_property(properties, 'gridSpan', 1)
+            v_merge = properties.find(_W + 'vMerge') if properties is not None else None
+            
+            if v_merge is not None and v_merge.get(_W + 'val', 'continue') == 'continue':
+                cell_text, cell_span = above[offset]
+            else:
+                cell_text = "\n".join(_docx_paragraph_text(p) for p in cell.iterchildren(_W + 'p'))
+                cell_span = grid_span
+            
+            cells[offset] = (cell_text, cell_span)
+            offset += grid_span
+            
+            cell_text = cell_text.strip()
+            if cell_text:
+                row_text.extend([cell_text] * cell_span)
+        
+        above = cells
+        if row_text:
+            rows.append(" | ".join(row_text))
+    
+    return rows
+
+def _docx_header_footer_ids(section):
+    """Relationship ids of a w:sectPr element's default header and footer, None if inherited"""
+    ids = []
+    for reference in ('headerReference', 'footerReference'):
+        element = section.find(f"{_W}{reference}[@{_W}type='default']")
+        ids.append(element.get(_R_ID) if element is not None else None)
+    return ids
+
+@lru_cache(maxsize=DOCX_DOCUMENT_CACHE_MAX_ENTRIES)
+def _open_docx_document(path, mtime_ns, size):
+    """Cached python-docx Document for a file on disk, keyed like _extract_file_text"""
+    return Document(path)
+
+def _pdfplumber_page_range(data, start, stop):
+    """Pool task: pdfplumber text of pages [start, stop) of a PDF given as bytes"""
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return [pdf.pages[index].extract_text() for index in range(start, stop)]
 
 class TextExtractor:
     """Base class for text extraction"""
     
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    def extract_text(self, file_path, **options):
+        """
+        Extract text from a file, reusing the result for unchanged files on disk
+        
+        Args:
+            file_path (str or file-like): Path to the file, or a binary file object
+            **options: Extractor-specific options passed on to _extract_text
+            
+        Returns:
+            str: Extracted text content
+        """
+        if hasattr(file_path, 'read'):
+            return self._extract_text(file_path, **options)
+        
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self._extract_text(file_path, **options)  # logs the error
+        
+        return _extract_file_text(type(self), os.fspath(file_path), stat.st_mtime_ns, stat.st_size,
+                                  **options)
     
-    def extract_text(self, file_path):
+    def _extract_text(self, file_path):
         """Extract text from file - to be implemented by subclasses"""
         raise NotImplementedError
 
 class PDFExtractor(TextExtractor):
     """Extract text from PDF files"""
     
-    def extract_text(self, file_path):
+    def extract_text(self, file_path, max_chars=MAX_PDF_TEXT_CHARS, parallel_pages=False):
+        """
+        Extract text from a PDF, stopping once enough text has been read
+        
+        Args:
+            file_path (str or file-like): Path to PDF file, or a binary file object
+            max_chars (int): Stop reading further pages after this many
+                characters; None reads every page
+            parallel_pages (bool): Let pdfplumber split long PDFs across worker
+                processes; only for callers outside threaded servers such as
+                Streamlit, which should not start a process pool per document
+            
+        Returns:
+            str: Extracted text content
+        """
+        return super().extract_text(file_path, max_chars=max_chars, parallel_pages=parallel_pages)
+    
+    def _extract_text(self, file_path, max_chars=None, parallel_pages=False):
         """
         Extract text from PDF file using multiple methods for better accuracy
         
         Args:
-            file_path (str): Path to PDF file
+            file_path (str or file-like): Path to PDF file, or a binary file object
+            max_chars (int): Stop reading further pages after this many
+                characters; None reads every page
+            parallel_pages (bool): Let pdfplumber split long PDFs across worker processes
             
         Returns:
             str: Extracted text content
@@ -30,139 +248,586 @@ class PDFExtractor(TextExtractor):
         text = ""
         
         try:
-            # First try with pdfplumber (better for complex layouts)
-            text = self._extract_with_pdfplumber(file_path)
+            # Read the file once; every method then parses the same in-memory
+            # copy instead of doing its own small buffered reads from disk
+            if not hasattr(file_path, 'read'):
+                with open(file_path, 'rb') as pdf_file:
+                    file_path = io.BytesIO(pdf_file.read())
             
-            if not text or len(text.strip()) < 100:
-                # Fallback to PyPDF2
-                text = self._extract_with_pypdf2(file_path)
+            if not self._preflight(file_path):
+                return text
+            
+            # PyMuPDF and PDFium when installed, then pdfplumber (better for
+            # complex layouts) and PyPDF2, until one finds enough text
+            methods = []
+            if pymupdf is not None:
+                methods.append(self._extract_with_pymupdf)
+            if pdfium is not None:
+                methods.append(self._extract_with_pdfium)
+            methods += [partial(self._extract_with_pdfplumber, parallel_pages=parallel_pages),
+                        self._extract_with_pypdf2]
+            
+            for method in methods:
+                # Rewind the buffer read by the previous method
+                self._rewind(file_path)
+                method_text = method(file_path, max_chars)
+                
+                # A method that finds too little text can still have found
+                # more than the next one; keep the longest result
+                if len(method_text.strip()) > len(text.strip()):
+                    text = method_text
+                if len(text.strip()) >= MIN_PDF_TEXT_LENGTH:
+                    break
             
         except Exception as e:
-            self.logger.error(f"Error extracting PDF text: {str(e)}")
+            logger.error(f"Error extracting PDF text: {str(e)}")
             
         return text.strip()
     
-    def _extract_with_pdfplumber(self, file_path):
+    def iter_pages(self, file_path):
+        """
+        Yield the text of a PDF page by page, so callers can start on the
+        first pages while later ones are still being parsed
+        
+        Pages come from PyMuPDF when it is installed and pdfplumber otherwise.
+        Unlike extract_text, no other method is tried when the pages have
+        little text, and nothing is cached.
+        
+        Args:
+            file_path (str or file-like): Path to PDF file, or a binary file object
+            
+        Yields:
+            tuple: (page_index, text) for each page
+        """
+        try:
+            if not hasattr(file_path, 'read'):
+                with open(file_path, 'rb') as pdf_file:
+                    file_path = io.BytesIO(pdf_file.read())
+            
+            if not self._preflight(file_path):
+                return
+            
+            if pymupdf is not None:
+                with pymupdf.open(stream=file_path.read(), filetype='pdf') as pdf:
+                    for page_index, page in enumerate(pdf):
+                        yield page_index, page.get_text("text")
+            else:
+                with pdfplumber.open(file_path) as pdf:
+                    for page_index, page in enumerate(pdf.pages):
+                        yield page_index, page.extract_text() or ""
+                        # Drop the page's parsed layout before the next one
+                        page.close()
+        except Exception as e:
+            logger.error(f"Error extracting PDF pages: {str(e)}")
+    
+    def _preflight(self, pdf_file):
+        """
+        Cheaply check that a PDF can be read before any method parses it
+        
+        Files without a PDF header, and encrypted PDFs that do not open with
+        an empty password, would only make every method fail in turn.
+        
+        Args:
+            pdf_file (file-like): Binary PDF file object
+            
+        Returns:
+            bool: True if extraction should be attempted
+        """
+        try:
+            head = pdf_file.read(PDF_HEADER_SEARCH_BYTES)
+            if b'%PDF-' not in head:
+                logger.warning("Skipping PDF extraction: file has no PDF header")
+                return False
+            
+            size = pdf_file.seek(0, io.SEEK_END)
+            pdf_file.seek(max(0, size - PDF_TRAILER_SEARCH_BYTES))
+            tail = pdf_file.read()
+            
+            if PDF_ENCRYPT_RE.search(head) or PDF_ENCRYPT_RE.search(tail):
+                # Many resumes are only owner-password protected, which still
+                # opens with an empty password; PdfReader only reads the xref here
+                self._rewind(pdf_file)
+                pdf_reader = PyPDF2.PdfReader(pdf_file)
+                if pdf_reader.is_encrypted and not pdf_reader.decrypt(""):
+                    logger.warning("Skipping PDF extraction: file is password protected")
+                    return False
+        except Exception as e:
+            # Let the extraction methods try and report the problem
+            logger.debug(f"PDF preflight check failed: {str(e)}")
+        finally:
+            self._rewind(pdf_file)
+            
+        return True
+    
+    @staticmethod
+    def _rewind(file_path):
+        """Move an in-memory file back to the start; paths are left alone"""
+        if hasattr(file_path, 'seek'):
+            file_path.seek(0)
+    
+    def _extract_with_pymupdf(self, file_path, max_chars=None):
+        """Extract text using PyMuPDF"""
+        page_parts = []
+        
+        try:
+            if hasattr(file_path, 'read'):
+                pdf = pymupdf.open(stream=file_path.read(), filetype='pdf')
+            else:
+                pdf = pymupdf.open(file_path)
+            
+            with pdf:
+                total_len = 0
+                for page in pdf:
+                    page_text = page.get_text("text")
+                    page_parts.append(page_text)
+                    total_len += len(page_text)
+                    if max_chars is not None and total_len >= max_chars:
+                        break
+        except Exception as e:
+            logger.warning(f"PyMuPDF extraction failed: {str(e)}")
+            
+        # Page text already ends with a newline, like the other methods add
+        return "".join(page_parts)
+    
+    def _extract_with_pdfium(self, file_path, max_chars=None):
+        """Extract text using pypdfium2"""
+        page_parts = []
+        
+        try:
+            # PdfDocument accepts either a path or a binary stream
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                total_len = 0
+                for page in pdf:
+                    text_page = page.get_textpage()
+                    # PDFium separates lines with CRLF
+                    page_text = text_page.get_text_range().replace("\r\n", "\n")
+                    text_page.close()
+                    page.close()
+                    if page_text:
+                        page_parts.append(page_text)
+                        total_len += len(page_text)
+                        if max_chars is not None and total_len >= max_chars:
+                            break
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.warning(f"pypdfium2 extraction failed: {str(e)}")
+            
+        return "\n".join(page_parts)
+    
+    def _extract_with_pdfplumber(self, file_path, max_chars=None, parallel_pages=False):
         """Extract text using pdfplumber"""
-        text = ""
+        page_parts = []
         
         try:
             with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
+                page_count = len(pdf.pages)
+                # Only a main process that asked for it on a multi-core machine
+                # starts a pool; parse workers already run in parallel and stay serial
+                if (parallel_pages and page_count >= PARALLEL_PDF_MIN_PAGES
+                        and (os.cpu_count() or 1) > 1 and multiprocessing.parent_process() is None):
+                    file_path.seek(0)
+                    page_texts = self._extract_pages_in_parallel(file_path.read(), page_count, max_chars)
+                else:
+                    page_texts = (page.extract_text() for page in pdf.pages)
+                
+                total_len = 0
+                for page_text in page_texts:
                     if page_text:
-                        text += page_text + "\n"
+                        page_parts.append(page_text)
+                        total_len += len(page_text)
+                        if max_chars is not None and total_len >= max_chars:
+                            break
         except Exception as e:
-            self.logger.warning(f"pdfplumber extraction failed: {str(e)}")
+            logger.warning(f"pdfplumber extraction failed: {str(e)}")
             
-        return text
+        return "\n".join(page_parts)
     
-    def _extract_with_pypdf2(self, file_path):
+    def _extract_pages_in_parallel(self, data, page_count, max_chars=None):
+        """
+        Extract pdfplumber page texts in worker processes
+        
+        Without a budget each worker gets one contiguous range of pages, so
+        the PDF bytes are sent once per worker rather than once per page.
+        With max_chars, smaller ranges are collected in page order and the
+        ranges not yet started are cancelled once the budget is met.
+        
+        Args:
+            data (bytes): PDF file contents
+            page_count (int): Number of pages in the PDF
+            max_chars (int): Stop after ranges holding this many characters;
+                None extracts every page
+            
+        Returns:
+            list: Text of each extracted page, in page order
+        """
+        # worker_init imports the parser, which imports this module
+        import worker_init
+        
+        workers = min(os.cpu_count() or 1, page_count)
+        if max_chars is None:
+            bounds = [page_count * worker // workers for worker in range(workers + 1)]
+        else:
+            bounds = list(range(0, page_count, PARALLEL_PDF_PAGES_PER_TASK)) + [page_count]
+        
+        page_texts = []
+        total_len = 0
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=worker_init.get_mp_context()) as executor:
+            futures = [executor.submit(_pdfplumber_page_range, data, start, stop)
+                       for start, stop in zip(bounds[:-1], bounds[1:])]
+            
+            for future in futures:
+                page_range = future.result()
+                page_texts.extend(page_range)
+                total_len += sum(len(page_text) for page_text in page_range if page_text)
+                if max_chars is not None and total_len >= max_chars:
+                    # Only the ranges already running are still finished
+                    executor.shutdown(cancel_futures=True)
+                    break
+        
+        return page_texts
+    
+    def _extract_with_pypdf2(self, file_path, max_chars=None):
         """Extract text using PyPDF2 as fallback"""
-        text = ""
+        page_parts = []
         
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                        
+            # PdfReader accepts either a path or a binary stream
+            pdf_reader = PyPDF2.PdfReader(file_path)
+            
+            total_len = 0
+            for page in pdf_reader.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    page_parts.append(page_text)
+                    total_len += len(page_text)
+                    if max_chars is not None and total_len >= max_chars:
+                        break
+                    
         except Exception as e:
-            self.logger.warning(f"PyPDF2 extraction failed: {str(e)}")
+            logger.warning(f"PyPDF2 extraction failed: {str(e)}")
             
-        return text
+        return "\n".join(page_parts)
 
 class DOCXExtractor(TextExtractor):
     """Extract text from DOCX files"""
     
-    def extract_text(self, file_path):
+    def _extract_text(self, file_path):
         """
         Extract text from DOCX file
         
         Args:
-            file_path (str): Path to DOCX file
+            file_path (str or file-like): Path to DOCX file, or a binary file object
             
         Returns:
             str: Extracted text content
         """
-        text = ""
-        
         try:
-            doc = Document(file_path)
-            
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = []
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
-                    if row_text:
-                        text += " | ".join(row_text) + "\n"
-            
-            # Extract text from headers and footers
-            for section in doc.sections:
-                # Header
-                if section.header:
-                    for paragraph in section.header.paragraphs:
-                        if paragraph.text.strip():
-                            text += paragraph.text + "\n"
-                
-                # Footer
-                if section.footer:
-                    for paragraph in section.footer.paragraphs:
-                        if paragraph.text.strip():
-                            text += paragraph.text + "\n"
-                            
+            return self._stream_text(file_path)
         except Exception as e:
-            self.logger.error(f"Error extracting DOCX text: {str(e)}")
+            logger.warning(f"Streaming DOCX extraction failed, using python-docx: {str(e)}")
             
-        return text.strip()
+        try:
+            if hasattr(file_path, 'seek'):
+                file_path.seek(0)
+            return self._read_document(self._load_document(file_path))
+        except Exception as e:
+            logger.error(f"Error extracting DOCX text: {str(e)}")
+            return ""
     
-    def extract_formatting_info(self, file_path):
+    def iter_pages(self, file_path, paragraphs_per_page=DOCX_PARAGRAPHS_PER_PAGE):
         """
-        Extract additional formatting information that might be useful
+        Yield the text of a DOCX file in page-sized groups of paragraphs
+        
+        The text is streamed from the archive, so the first groups are
+        available before the rest of the document has been parsed. Unlike
+        extract_text, there is no python-docx fallback and nothing is cached.
         
         Args:
-            file_path (str): Path to DOCX file
+            file_path (str or file-like): Path to DOCX file, or a binary file object
+            paragraphs_per_page (int): Paragraphs or table rows per group
+            
+        Yields:
+            tuple: (page_index, text) for each group
+        """
+        page_parts = []
+        page_index = 0
+        
+        try:
+            for part in self._iter_stream_parts(file_path):
+                page_parts.append(part)
+                if len(page_parts) == paragraphs_per_page:
+                    yield page_index, "\n".join(page_parts)
+                    page_parts = []
+                    page_index += 1
+            
+            if page_parts:
+                yield page_index, "\n".join(page_parts)
+        except Exception as e:
+            logger.error(f"Error extracting DOCX pages: {str(e)}")
+    
+    def extract_all(self, file_path):
+        """
+        Extract text and formatting information in a single pass over the document
+        
+        Args:
+            file_path (str or file-like): Path to DOCX file, or a binary file object
             
         Returns:
-            dict: Formatting information
+            dict: 'text' (str) and 'formatting' (dict, as from extract_formatting_info)
         """
         formatting_info = {
             'bold_text': [],
             'italic_text': [],
             'headings': []
         }
+        text = ""
         
         try:
-            doc = Document(file_path)
+            text = self._read_document(self._load_document(file_path), formatting_info)
+        except Exception as e:
+            logger.error(f"Error extracting DOCX text: {str(e)}")
+            
+        return {'text': text, 'formatting': formatting_info}
+    
+    def _stream_text(self, file_path):
+        """
+        Extract the same text as _read_document straight from the DOCX archive
+        
+        Args:
+            file_path (str or file-like): Path to DOCX file, or a binary file object
+            
+        Returns:
+            str: Extracted text content
+        """
+        return "\n".join(self._iter_stream_parts(file_path)).strip()
+    
+    def _iter_stream_parts(self, file_path):
+        """
+        Yield the non-blank paragraphs and table rows of a DOCX archive in extraction order
+        
+        word/document.xml is parsed incrementally and each top-level paragraph
+        or table is dropped once read, so no python-docx object model is built.
+        Body paragraphs are yielded as they are parsed; table rows, headers and
+        footers follow, as in _read_document.
+        
+        Args:
+            file_path (str or file-like): Path to DOCX file, or a binary file object
+            
+        Yields:
+            str: Text of one paragraph or table row
+        """
+        table_rows = []
+        sections = []
+        
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open('word/document.xml') as document_xml:
+                depth = 0
+                for event, element in etree.iterparse(document_xml, events=('start', 'end'),
+                                                      remove_blank_text=True, resolve_entities=False):
+                    if event == 'start':
+                        depth += 1
+                        continue
+                    depth -= 1
+                    
+                    # Only direct children of w:body, which ends at depth 2
+                    if depth != 2:
+                        continue
+                    
+                    if element.tag == _W + 'p':
+                        paragraph_text = _docx_paragraph_text(element)
+                        if paragraph_text.strip():
+                            yield paragraph_text
+                        section = element.find(f"{_W}pPr/{_W}sectPr")
+                        if section is not None:
+                            sections.append(_docx_header_footer_ids(section))
+                    elif element.tag == _W + 'tbl':
+                        table_rows.extend(_docx_table_rows(element))
+                    elif element.tag == _W + 'sectPr':
+                        sections.append(_docx_header_footer_ids(element))
+                    
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+            
+            yield from table_rows
+            
+            # Headers and footers, each section inheriting the previous one's
+            # when it has no definition of its own
+            part_names = {}
+            with archive.open('word/_rels/document.xml.rels') as rels_xml:
+                for relationship in etree.parse(rels_xml, _docx_xml_parser()).getroot().iter(_RELATIONSHIP):
+                    target = relationship.get('Target')
+                    if relationship.get('TargetMode') != 'External':
+                        part_names[relationship.get('Id')] = (
+                            target.lstrip('/') if target.startswith('/')
+                            else posixpath.normpath(posixpath.join('word', target)))
             
-            for paragraph in doc.paragraphs:
-                # Check for headings
-                if paragraph.style.name.startswith('Heading'):
+            part_paragraphs = {}
+            current_ids = [None, None]
+            for section_ids in sections:
+                current_ids = [rel_id or current for rel_id, current in zip(section_ids, current_ids)]
+                for rel_id in current_ids:
+                    if rel_id is None:
+                        continue
+                    if rel_id not in part_paragraphs:
+                        root = etree.fromstring(archive.read(part_names[rel_id]), _docx_xml_parser())
+                        part_paragraphs[rel_id] = [_docx_paragraph_text(p) for p in root.iterchildren(_W + 'p')]
+                    yield from (text for text in part_paragraphs[rel_id] if text.strip())
+    
+    def _read_document(self, doc, formatting_info=None):
+        """
+        Walk a document once, collecting its text and optionally its formatting
+        
+        Args:
+            doc (Document): Parsed python-docx document
+            formatting_info (dict): Lists to add headings, bold and italic text
+                of the body paragraphs to; None skips formatting
+            
+        Returns:
+            str: Extracted text content
+        """
+        parts = []
+        
+        # Extract text (and formatting) from paragraphs
+        for paragraph in doc.paragraphs:
+            # paragraph.text is rebuilt from the runs on every access
+            paragraph_text = paragraph.text
+            if paragraph_text.strip():
+                parts.append(paragraph_text)
+            
+            # Check for headings; paragraphs without a style of their own
+            # use the default one and skip the style lookup
+            if formatting_info is not None and paragraph._p.style is not None:
+                style_name = paragraph.style.name
+                if style_name in HEADING_STYLES:
                     formatting_info['headings'].append({
-                        'level': paragraph.style.name,
-                        'text': paragraph.text
+                        'level': style_name,
+                        'text': paragraph_text
                     })
-                
-                # Check for bold and italic text
-                for run in paragraph.runs:
-                    if run.bold and run.text.strip():
-                        formatting_info['bold_text'].append(run.text.strip())
-                    if run.italic and run.text.strip():
-                        formatting_info['italic_text'].append(run.text.strip())
-                        
-        except Exception as e:
-            self.logger.warning(f"Error extracting formatting info: {str(e)}")
+        
+        # Check for bold and italic text straight on the XML, without
+        # building python-docx Run objects for every run
+        if formatting_info is not None:
+            body = doc.element.body
+            for key, runs_xpath in (('bold_text', _BOLD_RUNS_XP), ('italic_text', _ITALIC_RUNS_XP)):
+                for run in runs_xpath(body):
+                    run_text = run.text.strip()
+                    if run_text:
+                        formatting_info[key].append(run_text)
+        
+        # Extract text from tables, reading the XML directly instead of
+        # building python-docx Table, _Row and _Cell objects
+        for table in doc.element.body.iterchildren(_W + 'tbl'):
+            parts.extend(_docx_table_rows(table))
+        
+        # Extract text from headers and footers
+        for section in doc.sections:
+            for part in (section.header, section.footer):
+                if part:
+                    for paragraph in part.paragraphs:
+                        paragraph_text = paragraph.text
+                        if paragraph_text.strip():
+                            parts.append(paragraph_text)
+        
+        return "\n".join(parts).strip()
+    
+    def _load_document(self, file_path):
+        """
+        Open a DOCX file, reusing the parsed document for unchanged files on disk
+        
+        The cached document is shared, so callers must only read from it.
+        
+        Args:
+            file_path (str or file-like): Path to DOCX file, or a binary file object
             
-        return formatting_info
+        Returns:
+            Document: Parsed python-docx document
+        """
+        if hasattr(file_path, 'read'):
+            return Document(file_path)
+        
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return Document(file_path)  # raises the error for the caller to log
+        
+        return _open_docx_document(os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
+    
+    def extract_formatting_info(self, file_path):
+        """
+        Extract additional formatting information that might be useful
+        
+        Args:
+            file_path (str or file-like): Path to DOCX file, or a binary file object
+            
+        Returns:
+            dict: Formatting information
+        """
+        return self.extract_all(file_path)['formatting']
+
+# Extractor for each file signature, created once and shared by extract()
+FILE_SIGNATURES = (
+    (b'PK\x03\x04', DOCXExtractor()),  # DOCX is a ZIP archive
+    (b'%PDF-', PDFExtractor()),
+)
+
+def _is_docx_archive(file_path):
+    """True if a ZIP file holds a Word document body, unlike .xlsx, .odt or plain .zip files"""
+    position = file_path.tell() if hasattr(file_path, 'read') else None
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            archive.getinfo('word/document.xml')
+        return True
+    except (KeyError, zipfile.BadZipFile):
+        return False
+    finally:
+        if position is not None:
+            file_path.seek(position)
+
+def get_extractor(file_path):
+    """
+    Pick the extractor for a file from its first bytes rather than its name
+    
+    Args:
+        file_path (str or file-like): Path to the file, or a binary file object
+        
+    Returns:
+        TextExtractor: Matching extractor, or None for an unsupported format
+    """
+    if hasattr(file_path, 'read'):
+        position = file_path.tell()
+        head = file_path.read(PDF_HEADER_SEARCH_BYTES)
+        file_path.seek(position)
+    else:
+        with open(file_path, 'rb') as file:
+            head = file.read(PDF_HEADER_SEARCH_BYTES)
+    
+    for signature, extractor in FILE_SIGNATURES:
+        # PDF readers accept a header anywhere in the first 1024 bytes
+        if head.startswith(signature) or (signature == b'%PDF-' and signature in head):
+            if isinstance(extractor, DOCXExtractor) and not _is_docx_archive(file_path):
+                return None
+            return extractor
+    return None
+
+def extract(file_path, parallel_pages=False):
+    """
+    Extract text from a PDF or DOCX file, detecting the format from its content
+    
+    Args:
+        file_path (str or file-like): Path to the file, or a binary file object
+        parallel_pages (bool): Let long PDFs be split across worker processes
+            (see PDFExtractor.extract_text)
+        
+    Returns:
+        str: Extracted text content
+    """
+    extractor = get_extractor(file_path)
+    if extractor is None:
+        raise ValueError("Unsupported file format")
+    if parallel_pages and isinstance(extractor, PDFExtractor):
+        return extractor.extract_text(file_path, parallel_pages=True)
+    return extractor.extract_text(file_path)
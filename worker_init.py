@@ -0,0 +1,29 @@
+"""
+Process pool setup for parallel resume parsing.
+
+The pool is started from the Streamlit server, which runs many threads, so
+its workers are never forked from it directly. On Linux they are forked from
+a single-threaded fork server that has already imported the parsing modules;
+elsewhere they are spawned. Either way each worker loads the spaCy model
+once in the initializer.
+"""
+
+import sys
+import multiprocessing
+from resume_parser import get_shared_parser
+
+def get_mp_context():
+    """
+    Returns the multiprocessing context used for the parsing pool.
+    forkserver is only used on Linux; macOS and Windows fall back to spawn.
+    """
+    if sys.platform.startswith('linux'):
+        context = multiprocessing.get_context('forkserver')
+        # Imported once in the fork server instead of in every worker
+        context.set_forkserver_preload(['worker_init'])
+        return context
+    return multiprocessing.get_context('spawn')
+
+def init():
+    """Pool initializer: make sure the worker's parser is loaded before the first task"""
+    get_shared_parser()
\ No newline at end of file